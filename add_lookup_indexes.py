@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Simple migration to add composite lookup indexes for mood entries, horoscope readings and events
+"""
+import sqlite3
+import os
+
+# (index name, table, columns) - kept in sync with __table_args__ in models.py
+INDEXES = [
+    ('ix_mood_user_created', 'mood_entry', ('user_id', 'created_at')),
+    ('ix_horoscope_user_date', 'horoscope_reading', ('user_id', 'reading_date')),
+    ('ix_horoscope_user_type_date', 'horoscope_reading', ('user_id', 'reading_type', 'reading_date')),
+    ('ix_event_type_date', 'astrological_event', ('event_type', 'event_date')),
+]
+
+def migrate():
+    db_path = 'instance/horoscope.db'
+    
+    print(f"🔍 Looking for database at: {db_path}")
+    
+    if not os.path.exists(db_path):
+        print("❌ Database file not found")
+        return False
+    
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    
+    try:
+        for index_name, table, columns in INDEXES:
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({", ".join(columns)})')
+            print(f'✅ Ensured index {index_name} on {table}')
+        conn.commit()
+        return True
+            
+    except Exception as e:
+        print(f'❌ Error: {e}')
+        conn.rollback()
+        return False
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
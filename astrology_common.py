@@ -0,0 +1,150 @@
+"""
+Shared helpers for the astrology calculators
+Caches for expensive lookups that are repeated across chart requests
+"""
+
+from collections import namedtuple
+from datetime import datetime, date, time, timedelta, timezone
+from functools import lru_cache
+from typing import Optional
+from weakref import WeakValueDictionary
+import re
+
+# Element, quality and traditional ruler of each zodiac sign
+SignInfo = namedtuple('SignInfo', 'element quality ruler')
+
+SIGN_TABLE = {
+    'Aries': SignInfo('Fire', 'Cardinal', 'Mars'),
+    'Taurus': SignInfo('Earth', 'Fixed', 'Venus'),
+    'Gemini': SignInfo('Air', 'Mutable', 'Mercury'),
+    'Cancer': SignInfo('Water', 'Cardinal', 'Moon'),
+    'Leo': SignInfo('Fire', 'Fixed', 'Sun'),
+    'Virgo': SignInfo('Earth', 'Mutable', 'Mercury'),
+    'Libra': SignInfo('Air', 'Cardinal', 'Venus'),
+    'Scorpio': SignInfo('Water', 'Fixed', 'Mars'),
+    'Sagittarius': SignInfo('Fire', 'Mutable', 'Jupiter'),
+    'Capricorn': SignInfo('Earth', 'Cardinal', 'Saturn'),
+    'Aquarius': SignInfo('Air', 'Fixed', 'Saturn'),
+    'Pisces': SignInfo('Water', 'Mutable', 'Jupiter')
+}
+
+UNKNOWN_SIGN = SignInfo('Unknown', 'Unknown', 'Unknown')
+
+# UTC offset timezone settings such as 'UTC+1', 'UTC-5', 'UTC+5:30' or 'UTC+5.5'
+_UTC_OFFSET_RE = re.compile(r'^UTC\s*([+-]?)(\d+(?:\.\d+)?)(?::(\d+))?\s*$')
+
+# pytz is only needed for named zones, so it is imported on first use
+_pytz = None
+
+def _get_pytz():
+    """Import pytz on first call and return the module"""
+    global _pytz
+    if _pytz is None:
+        import pytz
+        _pytz = pytz
+    return _pytz
+
+# Geocoders registered by calculator instances, keyed by id() so cache keys stay hashable
+_geocoders = WeakValueDictionary()
+
+class _GeocodeMiss(Exception):
+    """Raised inside the geocode cache so failed lookups are retried instead of memoized"""
+
+def register_geocoder(geocoder) -> int:
+    """Register a geocoder for cached lookups and return its cache id"""
+    _geocoders[id(geocoder)] = geocoder
+    return id(geocoder)
+
+@lru_cache(maxsize=4096)
+def _cached_geocode(geocoder_id: int, country: str, region: str, city: str):
+    coords = _geocoders[geocoder_id].get_coordinates_from_location(
+        country=country,
+        region=region,
+        city=city
+    )
+    if not coords:
+        raise _GeocodeMiss
+    return coords
+
+def cached_geocode(geocoder_id: int, country: str, region: str, city: str):
+    """Geocode a location with a registered geocoder, memoizing successful lookups"""
+    try:
+        return _cached_geocode(geocoder_id, country, region, city)
+    except _GeocodeMiss:
+        return None
+
+@lru_cache(maxsize=512)
+def get_timezone(name: str):
+    """Get a pytz timezone by name, caching the zoneinfo lookup"""
+    return _get_pytz().timezone(name)
+
+@lru_cache(maxsize=512)
+def _static_offset_minutes(name: str) -> Optional[int]:
+    """Get the constant UTC offset in minutes of a zone that never changes offset, else None"""
+    pytz = _get_pytz()
+    tz = get_timezone(name)
+    if tz is pytz.utc or isinstance(tz, pytz.tzinfo.StaticTzInfo):
+        return int(tz.utcoffset(None).total_seconds()) // 60
+    return None
+
+@lru_cache(maxsize=256)
+def get_fixed_offset(minutes: int) -> timezone:
+    """Get a stdlib fixed-offset timezone for an offset in minutes"""
+    return timezone(timedelta(minutes=minutes))
+
+def _fast_localize(birth_date: date, birth_time: time, offset_minutes: int) -> datetime:
+    """Build an aware datetime at a fixed offset without going through pytz.localize"""
+    return datetime.combine(birth_date, birth_time, tzinfo=get_fixed_offset(offset_minutes))
+
+def simple_chart_key(user) -> tuple:
+    """Hashable key for the birth data a simplified natal chart depends on"""
+    return (
+        user.id,
+        user.birth_date.isoformat(),
+        user.birth_time.isoformat() if user.birth_time else None,
+        user.birth_location,
+        user.latitude,
+        user.longitude,
+        user.timezone
+    )
+
+def parse_utc_offset_minutes(tz_name: str) -> Optional[int]:
+    """Parse a 'UTC±H[:MM]' timezone setting into minutes east of UTC, or None if it is not one"""
+    match = _UTC_OFFSET_RE.match(tz_name)
+    if not match:
+        return None
+    sign, hours, minutes = match.groups()
+    offset = int(float(hours) * 60 + (int(minutes) if minutes else 0))
+    if offset >= 24 * 60:
+        return None
+    # The sign applies to the minutes too, so 'UTC-3:30' is -210
+    return -offset if sign == '-' else offset
+
+def localize_birth_datetime(birth_date: date, birth_time: time,
+                            tz_name: Optional[str] = None,
+                            user_timezone: Optional[str] = None) -> datetime:
+    """
+    Combine a birth date and time into a timezone-aware datetime.
+    Uses the named zone if given, else a 'UTC±H[:MM]' user setting, else UTC.
+    """
+    # Apply timezone
+    if tz_name:
+        pytz = _get_pytz()
+        try:
+            offset = _static_offset_minutes(tz_name)
+        except pytz.UnknownTimeZoneError:
+            pass
+        else:
+            if offset is not None:
+                return _fast_localize(birth_date, birth_time, offset)
+            # Zones with DST or historical changes need pytz to pick the right offset
+            return get_timezone(tz_name).localize(datetime.combine(birth_date, birth_time))
+    
+    # Try user's timezone setting
+    if user_timezone:
+        minutes = parse_utc_offset_minutes(user_timezone)
+        if minutes is not None:
+            return _fast_localize(birth_date, birth_time, minutes)
+    
+    # Default to UTC
+    return _fast_localize(birth_date, birth_time, 0)
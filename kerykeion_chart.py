@@ -5,7 +5,15 @@ Supports Placidus house system and professional astrology standards
 
 from kerykeion import AstrologicalSubject, KerykeionChartSVG
 from datetime import datetime
+from functools import lru_cache
+import copy
+import math
+import numpy as np
 import pytz
+import re
+import os
+import base64
+import tempfile
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,6 +34,9 @@ SIGN_NAMES = {
     'Pis': 'Pisces'
 }
 
+# Full sign names in zodiac order, indexed by sign number (0 = Aries)
+SIGN_NAMES_ORDERED = tuple(SIGN_NAMES.values())
+
 # House name mappings to clean format
 HOUSE_NAMES = {
     'First_House': 'First',
@@ -42,6 +53,46 @@ HOUSE_NAMES = {
     'Twelfth_House': 'Twelfth'
 }
 
+# Subject attributes read when extracting detailed chart data
+_PLANET_ATTRS = ('sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto')
+_POINT_ATTRS = ('chiron', 'mean_lilith', 'mean_node', 'true_node', 'mean_south_node', 'true_south_node')
+_ANGLE_ATTRS = (
+    ('ascendant', 'ascendant'),
+    ('descendant', 'descendant'),
+    ('midheaven', 'medium_coeli'),
+    ('imum_coeli', 'imum_coeli')
+)
+_HOUSE_ATTRS = (
+    'first_house', 'second_house', 'third_house', 'fourth_house',
+    'fifth_house', 'sixth_house', 'seventh_house', 'eighth_house',
+    'ninth_house', 'tenth_house', 'eleventh_house', 'twelfth_house'
+)
+_SUBJECT_ATTRS = (
+    _PLANET_ATTRS + _POINT_ATTRS + tuple(attr for _, attr in _ANGLE_ATTRS) + _HOUSE_ATTRS +
+    ('lunar_phase', 'zodiac_type', 'perspective_type', 'local_time', 'utc_time', 'julian_day')
+)
+
+# Marks attributes the subject does not have in a snapshot
+_MISSING = object()
+
+def _snapshot_subject(subject):
+    """Read every chart attribute off the subject once, so properties are evaluated a single time"""
+    return {name: getattr(subject, name, _MISSING) for name in _SUBJECT_ATTRS}
+
+def _snapshot_get(snapshot, name, default=None):
+    """Get an attribute from a subject snapshot, or the default if the subject lacks it"""
+    value = snapshot[name]
+    return default if value is _MISSING else value
+
+# SVG rewriting patterns used by enhance_svg_for_web
+_SVG_WIDTH_RE = re.compile(r'width="(\d+)"')
+_SVG_HEIGHT_RE = re.compile(r'height="(\d+)"')
+_SVG_VIEWBOX_RE = re.compile(r'viewBox="[^"]*"')
+_SVG_ENHANCE_RE = re.compile(r'(width|height)="\d+"|font-size="(8|10|12)"')
+
+# Enlarged font sizes (8 and 12 both end up at 16, matching the old chained replaces)
+_SVG_FONT_SIZES = {'8': '16', '10': '14', '12': '16'}
+
 def decimal_to_dms(decimal_degrees):
     """Convert decimal degrees to degrees, minutes, seconds format"""
     degrees = int(decimal_degrees)
@@ -50,10 +101,94 @@ def decimal_to_dms(decimal_degrees):
     seconds = int((minutes_float - minutes) * 60)
     return f"{degrees}°{minutes:02d}'{seconds:02d}\""
 
+def decimal_to_dms_batch(values):
+    """Convert a sequence of decimal degrees to DMS strings in one vectorized pass"""
+    decimal_degrees = np.asarray(values, dtype=np.float64)
+    degrees = np.trunc(decimal_degrees)
+    minutes_float = (decimal_degrees - degrees) * 60
+    minutes = np.trunc(minutes_float)
+    seconds = np.trunc((minutes_float - minutes) * 60)
+    return [
+        f"{d}°{m:02d}'{s:02d}\""
+        for d, m, s in zip(degrees.astype(int).tolist(), minutes.astype(int).tolist(), seconds.astype(int).tolist())
+    ]
+
+# DMS fields in chart data entries and the decimal field each one is derived from
+_DMS_FIELDS = (
+    ('longitude_dms', 'longitude'),
+    ('cusp_dms', 'position_in_sign'),  # Use position in sign, not absolute
+    ('position_in_sign_dms', 'position_in_sign')
+)
+
+def _fill_dms_fields(*sections):
+    """Fill the DMS placeholders of every entry in the given chart sections in one batch"""
+    targets = []
+    values = []
+    for section in sections:
+        for entry in section.values():
+            for dms_key, source_key in _DMS_FIELDS:
+                if dms_key in entry:
+                    value = entry[source_key]
+                    # Missing or non-finite positions have no DMS form; keep them out of the batch
+                    if isinstance(value, (int, float)) and math.isfinite(value):
+                        targets.append((entry, dms_key))
+                        values.append(value)
+                    else:
+                        entry[dms_key] = None
+    for (entry, dms_key), dms in zip(targets, decimal_to_dms_batch(values)):
+        entry[dms_key] = dms
+
 def get_position_in_sign(longitude):
     """Get the position within the sign (0-30 degrees)"""
     return longitude % 30
 
+@lru_cache(maxsize=256)
+def _resolve_tz(tz_str):
+    """Resolve a timezone name or 'UTC±N' offset string to a cached pytz timezone"""
+    if tz_str.startswith('UTC'):
+        # Convert UTC-6 to Etc/GMT+6 (note the reversed sign for Etc/GMT)
+        _, minus, offset = tz_str.partition('-')
+        if minus:
+            return pytz.timezone(f'Etc/GMT+{offset}')
+        _, plus, offset = tz_str.partition('+')
+        if plus:
+            return pytz.timezone(f'Etc/GMT-{offset}')
+        return pytz.timezone('UTC')
+    return pytz.timezone(tz_str)
+
+@lru_cache(maxsize=512)
+def _subject_cached(name, year, month, day, hour, minute, city, nation, lat, lng, tz_str):
+    """
+    Build (or reuse) an AstrologicalSubject for the given birth data.
+    Coordinates are rounded to 4 decimals (~10 m) by the caller so repeat renders hit the cache.
+    The cached subject is never handed out; callers get deep copies from create_astrological_subject.
+    """
+    return AstrologicalSubject(
+        name=name,
+        year=year,
+        month=month,
+        day=day,
+        hour=hour,
+        minute=minute,
+        city=city,
+        nation=nation,
+        lat=lat,
+        lng=lng,
+        tz_str=tz_str,
+        houses_system_identifier="P"  # Placidus house system
+    )
+
+def _birth_location_parts(user):
+    """Get (city, country) from the user's birth_location, preferring the model's cached parse"""
+    get_parts = getattr(user, 'get_birth_location_parts', None)
+    if get_parts is not None:
+        return get_parts()
+    birth_location = getattr(user, 'birth_location', None)
+    if birth_location and ',' in birth_location:
+        location_parts = [part.strip() for part in birth_location.split(',')]
+        return location_parts[0], location_parts[-1]  # Last part is usually country
+    return None
+
 class ProfessionalAstrologyChart:
     """
     Professional astrology chart generator using Swiss Ephemeris via Kerykeion
@@ -69,22 +204,7 @@ class ProfessionalAstrologyChart:
         """
         try:
             # Convert user timezone to pytz timezone if it's a string
-            if isinstance(user.timezone, str):
-                # Handle UTC offset formats like 'UTC-6'
-                if user.timezone.startswith('UTC'):
-                    # Convert UTC-6 to Etc/GMT+6 (note the reversed sign for Etc/GMT)
-                    if '-' in user.timezone:
-                        offset = user.timezone.split('-')[1]
-                        user_tz = pytz.timezone(f'Etc/GMT+{offset}')
-                    elif '+' in user.timezone:
-                        offset = user.timezone.split('+')[1]
-                        user_tz = pytz.timezone(f'Etc/GMT-{offset}')
-                    else:
-                        user_tz = pytz.timezone('UTC')
-                else:
-                    user_tz = pytz.timezone(user.timezone)
-            else:
-                user_tz = user.timezone
+            user_tz = _resolve_tz(user.timezone) if isinstance(user.timezone, str) else user.timezone
             
             # Combine birth date and time
             birth_datetime = datetime.combine(user.birth_date, user.birth_time)
@@ -99,33 +219,32 @@ class ProfessionalAstrologyChart:
             birth_city = getattr(user, 'birth_city', None) or getattr(user, 'birth_location', 'Unknown City')
             birth_country = getattr(user, 'birth_country', None) or 'Unknown Country'
             
-            # If birth_location contains comma-separated values, parse them
-            if hasattr(user, 'birth_location') and ',' in user.birth_location:
-                location_parts = [part.strip() for part in user.birth_location.split(',')]
-                if len(location_parts) >= 2:
-                    birth_city = location_parts[0]
-                    birth_country = location_parts[-1]  # Last part is usually country
+            # If birth_location contains comma-separated values, use the parsed parts
+            location_parts = _birth_location_parts(user)
+            if location_parts:
+                birth_city, birth_country = location_parts
             
-            subject = AstrologicalSubject(
-                name=user_name.strip(),
-                year=birth_datetime.year,
-                month=birth_datetime.month,
-                day=birth_datetime.day,
-                hour=birth_datetime.hour,
-                minute=birth_datetime.minute,
-                city=birth_city,
-                nation=birth_country,
-                lat=float(user.latitude),
-                lng=float(user.longitude),
-                tz_str=str(user_tz),
-                houses_system_identifier="P"  # Placidus house system
-            )
+            # Deep copy the cached subject so the renderer can modify it without
+            # affecting other requests; copying is far cheaper than the ephemeris work
+            subject = copy.deepcopy(_subject_cached(
+                user_name.strip(),
+                birth_datetime.year,
+                birth_datetime.month,
+                birth_datetime.day,
+                birth_datetime.hour,
+                birth_datetime.minute,
+                birth_city,
+                birth_country,
+                round(float(user.latitude), 4),
+                round(float(user.longitude), 4),
+                str(user_tz)
+            ))
             
-            logger.info(f"Created AstrologicalSubject for {subject.name}")
+            logger.info("Created AstrologicalSubject for %s", subject.name)
             return subject
             
         except Exception as e:
-            logger.error(f"Error creating AstrologicalSubject: {e}")
+            logger.error("Error creating AstrologicalSubject: %s", e)
             return None
     
     def generate_svg_chart(self, user, chart_type="Natal"):
@@ -133,53 +252,53 @@ class ProfessionalAstrologyChart:
         Generate professional SVG chart using Kerykeion
         Returns SVG data as base64 string
         """
+        # Create astrological subject
+        subject = self.create_astrological_subject(user)
+        if not subject:
+            return None
+        return self.generate_svg_chart_from_subject(subject, chart_type)
+    
+    def generate_svg_chart_from_subject(self, subject, chart_type="Natal"):
+        """
+        Generate professional SVG chart from an existing AstrologicalSubject
+        Returns SVG data as base64 string
+        """
         try:
-            # Create astrological subject
-            subject = self.create_astrological_subject(user)
-            if not subject:
-                return None
-            
-            # Create SVG chart with custom settings for larger size
-            chart = KerykeionChartSVG(
-                first_obj=subject,
-                chart_type=chart_type,
-                new_output_directory="charts_output"
-            )
-            
-            # Generate the chart and get SVG content
-            chart.makeSVG()
-            
-            # Read the generated SVG file
-            import os
-            chart_filename = f"{subject.name} - {chart_type} Chart.svg"
-            chart_path = os.path.join("charts_output", chart_filename)
-            
-            if os.path.exists(chart_path):
-                with open(chart_path, 'r', encoding='utf-8') as f:
-                    svg_content = f.read()
+            # Render into a private directory so concurrent renders never share files
+            with tempfile.TemporaryDirectory(prefix="charts_output_") as output_dir:
+                # Create SVG chart with custom settings for larger size
+                chart = KerykeionChartSVG(
+                    first_obj=subject,
+                    chart_type=chart_type,
+                    new_output_directory=output_dir
+                )
                 
-                # Enhance SVG for better web display
-                svg_content = self.enhance_svg_for_web(svg_content)
+                # Generate the chart and get SVG content
+                chart.makeSVG()
                 
-                # Convert to base64 data URL
-                import base64
-                svg_base64 = base64.b64encode(svg_content.encode('utf-8')).decode('utf-8')
-                data_url = f"data:image/svg+xml;base64,{svg_base64}"
+                # Read the generated SVG file
+                chart_filename = f"{subject.name} - {chart_type} Chart.svg"
+                chart_path = os.path.join(output_dir, chart_filename)
                 
-                # Clean up the file
-                try:
-                    os.remove(chart_path)
-                except:
-                    pass
+                if not os.path.exists(chart_path):
+                    logger.error("SVG file not found: %s", chart_path)
+                    return None
                 
-                logger.info(f"Generated enhanced SVG chart for {subject.name}")
-                return data_url
-            else:
-                logger.error(f"SVG file not found: {chart_path}")
-                return None
+                with open(chart_path, 'r', encoding='utf-8') as f:
+                    svg_content = f.read()
+            
+            # Enhance SVG for better web display
+            svg_content = self.enhance_svg_for_web(svg_content)
+            
+            # Convert to base64 data URL
+            svg_base64 = base64.b64encode(svg_content.encode('utf-8')).decode('utf-8')
+            data_url = f"data:image/svg+xml;base64,{svg_base64}"
+            
+            logger.info("Generated enhanced SVG chart for %s", subject.name)
+            return data_url
             
         except Exception as e:
-            logger.error(f"Error generating SVG chart: {e}")
+            logger.error("Error generating SVG chart: %s", e)
             return None
     
     def enhance_svg_for_web(self, svg_content):
@@ -188,11 +307,9 @@ class ProfessionalAstrologyChart:
         """
         try:
             # Make chart responsive and larger
-            import re
-            
             # Find existing width and height
-            width_match = re.search(r'width="(\d+)"', svg_content)
-            height_match = re.search(r'height="(\d+)"', svg_content)
+            width_match = _SVG_WIDTH_RE.search(svg_content)
+            height_match = _SVG_HEIGHT_RE.search(svg_content)
             
             if width_match and height_match:
                 current_width = int(width_match.group(1))
@@ -202,27 +319,22 @@ class ProfessionalAstrologyChart:
                 new_width = int(current_width * 1.5)
                 new_height = int(current_height * 1.5)
                 
-                # Update SVG dimensions
-                svg_content = re.sub(r'width="\d+"', f'width="{new_width}"', svg_content)
-                svg_content = re.sub(r'height="\d+"', f'height="{new_height}"', svg_content)
+                # Update SVG dimensions and enhance text readability in a single pass
+                def _enhance(match):
+                    attr, font_size = match.groups()
+                    if font_size:
+                        return f'font-size="{_SVG_FONT_SIZES[font_size]}"'
+                    return f'{attr}="{new_width if attr == "width" else new_height}"'
+                
+                svg_content = _SVG_ENHANCE_RE.sub(_enhance, svg_content)
                 
                 # Add viewBox for responsiveness
-                viewbox_match = re.search(r'viewBox="[^"]*"', svg_content)
-                if not viewbox_match:
+                if not _SVG_VIEWBOX_RE.search(svg_content):
                     svg_content = svg_content.replace(
                         '<svg',
                         f'<svg viewBox="0 0 {new_width} {new_height}"'
                     )
                 
-                # Enhance text readability
-                svg_content = svg_content.replace(
-                    'font-size="8"', 'font-size="12"'
-                ).replace(
-                    'font-size="10"', 'font-size="14"'
-                ).replace(
-                    'font-size="12"', 'font-size="16"'
-                )
-                
                 # Add a professional border
                 border_style = f'''
                 <rect x="5" y="5" width="{new_width-10}" height="{new_height-10}" 
@@ -233,17 +345,25 @@ class ProfessionalAstrologyChart:
             return svg_content
             
         except Exception as e:
-            logger.warning(f"Could not enhance SVG: {e}")
+            logger.warning("Could not enhance SVG: %s", e)
             return svg_content
     
     def get_detailed_chart_data(self, user):
         """
         Get comprehensive astrological data including all Kerykeion features
         """
+        subject = self.create_astrological_subject(user)
+        if not subject:
+            return None
+        return self.get_detailed_chart_data_from_subject(subject)
+    
+    def get_detailed_chart_data_from_subject(self, subject):
+        """
+        Get comprehensive astrological data from an existing AstrologicalSubject
+        """
         try:
-            subject = self.create_astrological_subject(user)
-            if not subject:
-                return None
+            # Read every subject attribute once up front
+            snapshot = _snapshot_subject(subject)
             
             # Extract comprehensive chart data
             chart_data = {
@@ -261,106 +381,109 @@ class ProfessionalAstrologyChart:
                     'location': f"{subject.city}, {subject.nation}",
                     'coordinates': f"{subject.lat:.4f}, {subject.lng:.4f}",
                     'timezone': subject.tz_str,
-                    'julian_day': getattr(subject, 'julian_day', None)
+                    'julian_day': _snapshot_get(snapshot, 'julian_day')
                 }
             }
             
+            # Bind hot-loop helpers to locals once
+            _sign_get = SIGN_NAMES.get
+            _house_get = HOUSE_NAMES.get
+            planets_out = chart_data['planets']
+            points_out = chart_data['additional_points']
+            angles_out = chart_data['angles']
+            houses_out = chart_data['houses']
+            
             # Extract planets data with full details
-            planets = ['sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']
-            for planet_name in planets:
-                if hasattr(subject, planet_name):
-                    planet = getattr(subject, planet_name)
-                    sign_name = SIGN_NAMES.get(planet.sign, planet.sign)
-                    house_name = HOUSE_NAMES.get(planet.house, planet.house)
-                    
-                    chart_data['planets'][planet.name] = {
-                        'longitude': planet.abs_pos,
-                        'longitude_dms': decimal_to_dms(planet.abs_pos),
+            for planet_name in _PLANET_ATTRS:
+                planet = snapshot[planet_name]
+                if planet is _MISSING:
+                    continue
+                planets_out[planet.name] = {
+                    'longitude': planet.abs_pos,
+                    'longitude_dms': None,
+                    'sign': _sign_get(planet.sign, planet.sign),
+                    'sign_num': planet.sign_num,
+                    'position_in_sign': planet.position,
+                    'position_in_sign_dms': None,
+                    'house': _house_get(planet.house, planet.house),
+                    'retrograde': planet.retrograde,
+                    'element': getattr(planet, 'element', None),
+                    'quality': getattr(planet, 'quality', None),
+                    'emoji': getattr(planet, 'emoji', None)
+                }
+
+            # Extract additional celestial points
+            for point_name in _POINT_ATTRS:
+                point = snapshot[point_name]
+                if point is _MISSING:
+                    continue
+                if hasattr(point, 'abs_pos'):  # Check if it's a celestial object
+                    sign_name = _sign_get(getattr(point, 'sign', ''), getattr(point, 'sign', ''))
+                    house_name = _house_get(getattr(point, 'house', ''), getattr(point, 'house', ''))
+                    position_in_sign = getattr(point, 'position', point.abs_pos % 30)
+
+                    points_out[point.name if hasattr(point, 'name') else point_name] = {
+                        'longitude': point.abs_pos,
+                        'longitude_dms': None,
                         'sign': sign_name,
-                        'sign_num': planet.sign_num,
-                        'position_in_sign': planet.position,
-                        'position_in_sign_dms': decimal_to_dms(planet.position),
+                        'position_in_sign': position_in_sign,
+                        'position_in_sign_dms': None,
                         'house': house_name,
-                        'retrograde': planet.retrograde,
-                        'element': getattr(planet, 'element', None),
-                        'quality': getattr(planet, 'quality', None),
-                        'emoji': getattr(planet, 'emoji', None)
+                        'retrograde': getattr(point, 'retrograde', False)
                     }
             
-            # Extract additional celestial points
-            additional_points = ['chiron', 'mean_lilith', 'mean_node', 'true_node', 'mean_south_node', 'true_south_node']
-            for point_name in additional_points:
-                if hasattr(subject, point_name):
-                    point = getattr(subject, point_name)
-                    if hasattr(point, 'abs_pos'):  # Check if it's a celestial object
-                        sign_name = SIGN_NAMES.get(getattr(point, 'sign', ''), getattr(point, 'sign', ''))
-                        house_name = HOUSE_NAMES.get(getattr(point, 'house', ''), getattr(point, 'house', ''))
-                        position_in_sign = getattr(point, 'position', point.abs_pos % 30)
-                        
-                        chart_data['additional_points'][point.name if hasattr(point, 'name') else point_name] = {
-                            'longitude': point.abs_pos,
-                            'longitude_dms': decimal_to_dms(point.abs_pos),
-                            'sign': sign_name,
-                            'position_in_sign': position_in_sign,
-                            'position_in_sign_dms': decimal_to_dms(position_in_sign),
-                            'house': house_name,
-                            'retrograde': getattr(point, 'retrograde', False)
-                        }
-            
             # Extract angular points (Ascendant, Descendant, MC, IC)
-            angular_points = {
-                'ascendant': getattr(subject, 'ascendant', None),
-                'descendant': getattr(subject, 'descendant', None), 
-                'midheaven': getattr(subject, 'medium_coeli', None),
-                'imum_coeli': getattr(subject, 'imum_coeli', None)
-            }
-            
-            for angle_name, angle_value in angular_points.items():
-                if angle_value is not None:
-                    if hasattr(angle_value, 'abs_pos'):
-                        longitude = angle_value.abs_pos
-                        sign_name = SIGN_NAMES.get(getattr(angle_value, 'sign', ''), '')
-                        position_in_sign = getattr(angle_value, 'position', longitude % 30)
-                    else:
-                        longitude = float(angle_value)
-                        # Calculate sign from longitude
-                        sign_num = int(longitude // 30)
-                        sign_name = list(SIGN_NAMES.values())[sign_num] if sign_num < 12 else ''
-                        position_in_sign = longitude % 30
-                    
-                    chart_data['angles'][angle_name] = {
-                        'longitude': longitude,
-                        'longitude_dms': decimal_to_dms(longitude),
-                        'sign': sign_name,
-                        'position_in_sign': position_in_sign,
-                        'position_in_sign_dms': decimal_to_dms(position_in_sign)
-                    }
+            for angle_name, angle_attr in _ANGLE_ATTRS:
+                angle_value = _snapshot_get(snapshot, angle_attr)
+                if angle_value is None:
+                    continue
+                # Fetch the absolute position once; plain numbers carry no abs_pos
+                lon = getattr(angle_value, 'abs_pos', None)
+                if lon is not None:
+                    sign_name = _sign_get(getattr(angle_value, 'sign', ''), '')
+                    pos = getattr(angle_value, 'position', None)
+                    if pos is None:
+                        pos = lon % 30
+                else:
+                    lon = float(angle_value)
+                    # Calculate sign from longitude
+                    sign_name = SIGN_NAMES_ORDERED[int(lon // 30) % 12]
+                    pos = lon % 30
+                
+                angles_out[angle_name] = {
+                    'longitude': lon,
+                    'longitude_dms': None,
+                    'sign': sign_name,
+                    'position_in_sign': pos,
+                    'position_in_sign_dms': None
+                }
             
             # Extract houses data with full details
-            houses = ['first_house', 'second_house', 'third_house', 'fourth_house', 
-                     'fifth_house', 'sixth_house', 'seventh_house', 'eighth_house',
-                     'ninth_house', 'tenth_house', 'eleventh_house', 'twelfth_house']
-            for i, house_name in enumerate(houses, 1):
-                if hasattr(subject, house_name):
-                    house = getattr(subject, house_name)
-                    sign_name = SIGN_NAMES.get(house.sign, house.sign)
-                    position_in_sign = house.abs_pos % 30
-                    
-                    chart_data['houses'][f'house_{i}'] = {
-                        'cusp': house.abs_pos,
-                        'cusp_dms': decimal_to_dms(position_in_sign),  # Use position in sign, not absolute
-                        'sign': sign_name,
-                        'sign_num': house.sign_num,
-                        'position_in_sign': position_in_sign,
-                        'position_in_sign_dms': decimal_to_dms(position_in_sign),
-                        'quality': getattr(house, 'quality', None),
-                        'element': getattr(house, 'element', None)
-                    }
+            for i, house_attr in enumerate(_HOUSE_ATTRS, 1):
+                house = snapshot[house_attr]
+                if house is _MISSING:
+                    continue
+                sign_name = _sign_get(house.sign, house.sign)
+                position_in_sign = house.abs_pos % 30
+
+                houses_out[f'house_{i}'] = {
+                    'cusp': house.abs_pos,
+                    'cusp_dms': None,
+                    'sign': sign_name,
+                    'sign_num': house.sign_num,
+                    'position_in_sign': position_in_sign,
+                    'position_in_sign_dms': None,
+                    'quality': getattr(house, 'quality', None),
+                    'element': getattr(house, 'element', None)
+                }
+            
+            # DMS strings are filled in one vectorized batch once every position is known
+            _fill_dms_fields(planets_out, points_out, angles_out, houses_out)
             
             # Extract lunar data
-            if hasattr(subject, 'lunar_phase'):
+            if snapshot['lunar_phase'] is not _MISSING:
                 lunar_data = {
-                    'phase': getattr(subject, 'lunar_phase', None),
+                    'phase': snapshot['lunar_phase'],
                     'moon_sign': chart_data['planets'].get('Moon', {}).get('sign')
                 }
                 # Only add emoji if it exists and can be safely encoded
@@ -376,21 +499,21 @@ class ProfessionalAstrologyChart:
             # Chart metadata
             chart_data['chart_metadata'] = {
                 'house_system': 'Placidus',
-                'zodiac_type': getattr(subject, 'zodiac_type', 'Tropical'),
-                'perspective_type': getattr(subject, 'perspective_type', 'Geocentric'),
+                'zodiac_type': _snapshot_get(snapshot, 'zodiac_type', 'Tropical'),
+                'perspective_type': _snapshot_get(snapshot, 'perspective_type', 'Geocentric'),
                 'calculation_date': f"{subject.year}-{subject.month:02d}-{subject.day:02d}",
-                'local_time': getattr(subject, 'local_time', None),
-                'utc_time': getattr(subject, 'utc_time', None)
+                'local_time': _snapshot_get(snapshot, 'local_time'),
+                'utc_time': _snapshot_get(snapshot, 'utc_time')
             }
             
             # TODO: Extract aspects (will be implemented in next update)
             chart_data['aspects'] = []
             
-            logger.info(f"Extracted comprehensive chart data for {subject.name}")
+            logger.info("Extracted comprehensive chart data for %s", subject.name)
             return chart_data
             
         except Exception as e:
-            logger.error(f"Error extracting comprehensive chart data: {e}")
+            logger.error("Error extracting comprehensive chart data: %s", e)
             return None
 
 def create_professional_chart(user, chart_format="svg"):
@@ -406,16 +529,28 @@ def create_professional_chart(user, chart_format="svg"):
     """
     chart_generator = ProfessionalAstrologyChart()
     
-    if chart_format == "svg":
-        return chart_generator.generate_svg_chart(user)
-    elif chart_format == "data":
-        return chart_generator.get_detailed_chart_data(user)
-    else:
-        # Return both
-        return {
-            'chart_svg': chart_generator.generate_svg_chart(user),
-            'chart_data': chart_generator.get_detailed_chart_data(user)
-        }
+    # Build the subject once for whichever generator is requested
+    subject = chart_generator.create_astrological_subject(user)
+    
+    generate = {
+        'svg': chart_generator.generate_svg_chart_from_subject,
+        'data': chart_generator.get_detailed_chart_data_from_subject
+    }.get(chart_format)
+    
+    if generate is not None:
+        return generate(subject) if subject else None
+    
+    # Return both
+    if not subject:
+        return {'chart_svg': None, 'chart_data': None}
+    
+    # Both generators share the one subject. The data extraction only reads it,
+    # so it runs first; the SVG renderer, which may modify it, runs last
+    chart_data = chart_generator.get_detailed_chart_data_from_subject(subject)
+    return {
+        'chart_svg': chart_generator.generate_svg_chart_from_subject(subject),
+        'chart_data': chart_data
+    }
 
 # Test function
 def test_kerykeion_chart():
@@ -1,8 +1,58 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
+from sqlalchemy.orm import validates
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, date, time
+import os
 import json
+import logging
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Optional cheaper password hash method for tests/dev seeding (e.g. 'pbkdf2:sha256:1000').
+# Leave unset in production to use Werkzeug's default work factor.
+PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD')
+
+def _orjson_default(value):
+    """Serialize float subclasses orjson rejects the way json.dumps does"""
+    if isinstance(value, float):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def _json_dumps(value):
+    """Serialize a value to a JSON string for storage in a TEXT column"""
+    if ORJSON_AVAILABLE:
+        # orjson returns bytes; decode once since the columns are TEXT.
+        # Unlike json.dumps it writes NaN/Infinity as null.
+        return orjson.dumps(
+            value,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    return json.dumps(value)
+
+def _json_loads(value):
+    """Deserialize a JSON string read from a TEXT column"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # Rows written by json.dumps may hold NaN/Infinity, which orjson rejects
+            pass
+    return json.loads(value)
+
+def _split_birth_location(birth_location):
+    """Split a comma-separated birth location into (city, country), or None"""
+    if birth_location and ',' in birth_location:
+        location_parts = [part.strip() for part in birth_location.split(',')]
+        return location_parts[0], location_parts[-1]  # Last part is usually country
+    return None
 
 db = SQLAlchemy()
 
@@ -49,7 +99,10 @@ class User(UserMixin, db.Model):
     
     def set_password(self, password):
         """Hash and set user password"""
-        self.password_hash = generate_password_hash(password)
+        if PASSWORD_HASH_METHOD:
+            self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+        else:
+            self.password_hash = generate_password_hash(password)
     
     def check_password(self, password):
         """Check if provided password matches hash"""
@@ -76,13 +129,32 @@ class User(UserMixin, db.Model):
         has_coordinates = (self.latitude is not None and self.longitude is not None)
         
         # Debug logging
-        print(f"Birth info check for user {self.id}:")
-        print(f"  - has_basic_info: {has_basic_info} (date: {self.birth_date}, time: {self.birth_time})")
-        print(f"  - has_location: {has_location} (location: {self.birth_location}, country: {self.birth_country}, city: {self.birth_city})")
-        print(f"  - has_coordinates: {has_coordinates} (lat: {self.latitude}, lng: {self.longitude})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Birth info check for user %s: basic=%s (date: %s, time: %s) "
+                "location=%s (location: %s, country: %s, city: %s) coords=%s (lat: %s, lng: %s)",
+                self.id, has_basic_info, self.birth_date, self.birth_time,
+                has_location, self.birth_location, self.birth_country, self.birth_city,
+                has_coordinates, self.latitude, self.longitude
+            )
         
         return has_basic_info and has_location and has_coordinates
     
+    @validates('birth_location')
+    def _parse_birth_location(self, key, value):
+        """Cache the parsed (city, country) whenever birth_location is written"""
+        self._birth_location_parts = _split_birth_location(value)
+        return value
+    
+    def get_birth_location_parts(self):
+        """Get (city, country) parsed from birth_location, or None if it has no comma"""
+        try:
+            return self._birth_location_parts
+        except AttributeError:
+            # Loaded from the database, so the validator never ran
+            self._birth_location_parts = _split_birth_location(self.birth_location)
+            return self._birth_location_parts
+    
     def get_full_birth_location(self):
         """Get formatted birth location string"""
         if self.birth_city and self.birth_country:
@@ -106,6 +178,10 @@ class User(UserMixin, db.Model):
         }
 
 class MoodEntry(db.Model):
+    __table_args__ = (
+        db.Index('ix_mood_user_created', 'user_id', 'created_at'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     
@@ -124,11 +200,11 @@ class MoodEntry(db.Model):
     
     def set_emotions(self, emotion_list):
         """Set emotions as JSON string"""
-        self.emotions = json.dumps(emotion_list) if emotion_list else None
+        self.emotions = _json_dumps(emotion_list) if emotion_list else None
     
     def get_emotions(self):
         """Get emotions as list"""
-        return json.loads(self.emotions) if self.emotions else []
+        return _json_loads(self.emotions) if self.emotions else []
     
     def to_dict(self):
         """Convert mood entry to dictionary"""
@@ -143,6 +219,11 @@ class MoodEntry(db.Model):
         }
 
 class HoroscopeReading(db.Model):
+    __table_args__ = (
+        db.Index('ix_horoscope_user_date', 'user_id', 'reading_date'),
+        db.Index('ix_horoscope_user_type_date', 'user_id', 'reading_type', 'reading_date'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     
@@ -172,16 +253,16 @@ class HoroscopeReading(db.Model):
     
     def set_planetary_data(self, positions, transits, aspects):
         """Set astrological data as JSON strings"""
-        self.planetary_positions = json.dumps(positions) if positions else None
-        self.current_transits = json.dumps(transits) if transits else None
-        self.aspects = json.dumps(aspects) if aspects else None
+        self.planetary_positions = _json_dumps(positions) if positions else None
+        self.current_transits = _json_dumps(transits) if transits else None
+        self.aspects = _json_dumps(aspects) if aspects else None
     
     def get_planetary_data(self):
         """Get astrological data as dictionaries"""
         return {
-            'positions': json.loads(self.planetary_positions) if self.planetary_positions else {},
-            'transits': json.loads(self.current_transits) if self.current_transits else {},
-            'aspects': json.loads(self.aspects) if self.aspects else {}
+            'positions': _json_loads(self.planetary_positions) if self.planetary_positions else {},
+            'transits': _json_loads(self.current_transits) if self.current_transits else {},
+            'aspects': _json_loads(self.aspects) if self.aspects else {}
         }
     
     def to_dict(self):
@@ -198,6 +279,10 @@ class HoroscopeReading(db.Model):
 
 class AstrologicalEvent(db.Model):
     """Store significant astrological events for reference"""
+    __table_args__ = (
+        db.Index('ix_event_type_date', 'event_type', 'event_date'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     
     event_type = db.Column(db.String(50), nullable=False)  # full_moon, new_moon, retrograde, etc.
@@ -213,8 +298,8 @@ class AstrologicalEvent(db.Model):
     
     def set_keywords(self, keyword_list):
         """Set influence keywords as JSON string"""
-        self.influence_keywords = json.dumps(keyword_list) if keyword_list else None
+        self.influence_keywords = _json_dumps(keyword_list) if keyword_list else None
     
     def get_keywords(self):
         """Get influence keywords as list"""
-        return json.loads(self.influence_keywords) if self.influence_keywords else []
\ No newline at end of file
+        return _json_loads(self.influence_keywords) if self.influence_keywords else []
\ No newline at end of file
@@ -1,7 +1,23 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, render_template, jsonify, send_from_directory
 from datetime import datetime
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_response(obj, status=200):
+    """JSON response serialized with orjson when available, else Flask's jsonify"""
+    if ORJSON_AVAILABLE:
+        return Response(
+            orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+            status=status,
+            mimetype='application/json'
+        )
+    return jsonify(obj), status
+
 # Add this route to your existing app.py
 @app.route('/modern')
 def modern_astrology():
@@ -11,30 +27,22 @@ def modern_astrology():
 @app.route('/api/chart-data', methods=['POST'])
 def get_chart_data():
     """API endpoint to get chart data for the modern interface"""
+    # The response only uses the stored birth info, so check for it before anything else
+    if not (current_user.is_authenticated and current_user.has_complete_birth_info()):
+        return _json_response({'error': 'No birth information available'}, 400)
+    
     try:
-        data = request.get_json()
+        birth_datetime = datetime.combine(current_user.birth_date, current_user.birth_time)
         
-        # Extract birth information
-        birth_date = data.get('birth_date')
-        birth_time = data.get('birth_time') 
-        latitude = float(data.get('latitude'))
-        longitude = float(data.get('longitude'))
+        response_data = {
+            'birth_datetime': birth_datetime.isoformat(),
+            'latitude': current_user.latitude,
+            'longitude': current_user.longitude,
+            'city': current_user.location or '',
+            'timezone': current_user.timezone or 'UTC'
+        }
         
-        # For now, return the user's existing birth info if available
-        if current_user.is_authenticated and current_user.has_complete_birth_info():
-            birth_datetime = datetime.combine(current_user.birth_date, current_user.birth_time)
-            
-            response_data = {
-                'birth_datetime': birth_datetime.isoformat(),
-                'latitude': current_user.latitude,
-                'longitude': current_user.longitude,
-                'city': current_user.location or '',
-                'timezone': current_user.timezone or 'UTC'
-            }
-            
-            return jsonify(response_data)
-        else:
-            return jsonify({'error': 'No birth information available'}), 400
+        return _json_response(response_data)
             
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return _json_response({'error': str(e)}, 500)
\ No newline at end of file
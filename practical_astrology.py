@@ -4,9 +4,11 @@ This version provides better location handling and astronomical accuracy without
 """
 
 import os
+import copy
+import logging
+from collections import OrderedDict
 from datetime import datetime, date, time
 from typing import Dict, List, Tuple, Optional
-import pytz
 
 try:
     from astronomical_system import AstronomicalCalculator, GeographicalCoordinate
@@ -15,6 +17,15 @@ except ImportError:
     ROBUST_SYSTEM_AVAILABLE = False
 
 from astrology_simple import AstrologyCalculator as SimpleCalculator
+from astrology_common import (
+    register_geocoder, cached_geocode, localize_birth_datetime, simple_chart_key,
+    SIGN_TABLE, UNKNOWN_SIGN
+)
+
+logger = logging.getLogger(__name__)
+
+# Most simplified charts kept per calculator; the least recently used is evicted first
+_SIMPLE_CHART_CACHE_SIZE = 1024
 
 class PracticalAstrologyCalculator:
     """
@@ -22,119 +33,75 @@ class PracticalAstrologyCalculator:
     and provides better astronomical calculations when possible
     """
     
+    __slots__ = (
+        'simple_calc', 'astronomical_calc', 'geocoder_id',
+        '_interpretation_cache', '_simple_chart_cache'
+    )
+    
+    # Enhanced zodiac and planetary data
+    SIGNS = (
+        'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+        'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
+    )
+    
     def __init__(self):
         self.simple_calc = SimpleCalculator()  # Always available fallback
         
         if ROBUST_SYSTEM_AVAILABLE:
             self.astronomical_calc = AstronomicalCalculator()
-            self.location_cache = {}
+            self.geocoder_id = register_geocoder(self.astronomical_calc)
         
-        # Enhanced zodiac and planetary data
-        self.signs = [
-            'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-            'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-        ]
+        # Sign interpretations are static, so build each one only once
+        self._interpretation_cache = {}
         
-        self.sign_elements = {
-            'Aries': 'Fire', 'Leo': 'Fire', 'Sagittarius': 'Fire',
-            'Taurus': 'Earth', 'Virgo': 'Earth', 'Capricorn': 'Earth',
-            'Gemini': 'Air', 'Libra': 'Air', 'Aquarius': 'Air',
-            'Cancer': 'Water', 'Scorpio': 'Water', 'Pisces': 'Water'
-        }
-        
-        self.sign_qualities = {
-            'Aries': 'Cardinal', 'Cancer': 'Cardinal', 'Libra': 'Cardinal', 'Capricorn': 'Cardinal',
-            'Taurus': 'Fixed', 'Leo': 'Fixed', 'Scorpio': 'Fixed', 'Aquarius': 'Fixed',
-            'Gemini': 'Mutable', 'Virgo': 'Mutable', 'Sagittarius': 'Mutable', 'Pisces': 'Mutable'
-        }
+        # Simplified charts keyed by birth data, see _simple_chart
+        self._simple_chart_cache = OrderedDict()
         
     def get_enhanced_coordinates(self, user) -> Optional[GeographicalCoordinate]:
         """Get enhanced geographical coordinates for user's birth location"""
         if not ROBUST_SYSTEM_AVAILABLE:
             return None
-            
-        try:
-            # Use new location fields if available
-            if user.birth_country and user.birth_city:
-                cache_key = f"{user.birth_city}-{user.birth_region}-{user.birth_country}"
-                
-                if cache_key in self.location_cache:
-                    return self.location_cache[cache_key]
-                
-                coords = self.astronomical_calc.get_coordinates_from_location(
-                    country=user.birth_country,
-                    region=user.birth_region,
-                    city=user.birth_city
-                )
-                
-                if coords:
-                    self.location_cache[cache_key] = coords
-                    return coords
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error getting enhanced coordinates: {e}")
-            return None
+        
+        # Use new location fields if available
+        if user.birth_country and user.birth_city:
+            return cached_geocode(
+                self.geocoder_id,
+                user.birth_country,
+                user.birth_region or '',
+                user.birth_city
+            )
+        
+        return None
     
     def create_timezone_aware_datetime(self, user, coordinates: Optional[GeographicalCoordinate] = None) -> datetime:
         """Create proper timezone-aware birth datetime"""
-        try:
-            # Combine date and time
-            birth_time = user.birth_time or time(12, 0)  # Default to noon
-            birth_dt = datetime.combine(user.birth_date, birth_time)
-            
-            # Apply timezone
-            if coordinates and coordinates.timezone:
-                try:
-                    tz = pytz.timezone(coordinates.timezone)
-                    birth_dt = tz.localize(birth_dt)
-                    return birth_dt
-                except:
-                    pass
-            
-            # Try user's timezone setting
-            if user.timezone:
-                try:
-                    if user.timezone.startswith('UTC'):
-                        offset_str = user.timezone[3:]  # Remove 'UTC' prefix
-                        if offset_str:
-                            # Parse offset like +1, -5, +5:30
-                            if ':' in offset_str:
-                                hours, minutes = offset_str.split(':')
-                                offset_hours = float(hours) + float(minutes)/60
-                            else:
-                                offset_hours = float(offset_str)
-                            
-                            tz = pytz.FixedOffset(int(offset_hours * 60))
-                            birth_dt = tz.localize(birth_dt)
-                            return birth_dt
-                except:
-                    pass
-            
-            # Default to UTC
-            return pytz.utc.localize(birth_dt)
-            
-        except Exception as e:
-            print(f"Error creating timezone-aware datetime: {e}")
-            return datetime.combine(user.birth_date, birth_time or time(12, 0))
+        if not user.birth_date:
+            raise ValueError("Birth date is required to create a birth datetime")
+        
+        # Unknown zone names and offsets fall back to UTC inside localize_birth_datetime
+        return localize_birth_datetime(
+            user.birth_date,
+            user.birth_time or time(12, 0),  # Default to noon
+            coordinates.timezone if coordinates else None,
+            user.timezone
+        )
     
     def generate_natal_chart(self, user) -> Optional[Dict]:
         """Generate enhanced natal chart"""
         if not user.birth_date:
             return None
         
+        # Use simple calculator but enhance the results
+        simple_chart = self._simple_chart(user)
+        
         try:
             # Get enhanced coordinates if available
             coordinates = self.get_enhanced_coordinates(user)
             
-            # Create timezone-aware datetime
-            birth_dt = self.create_timezone_aware_datetime(user, coordinates)
-            
-            # Use simple calculator but enhance the results
-            chart = self.simple_calc.generate_natal_chart(user)
-            
-            if chart and coordinates:
+            if simple_chart and coordinates:
+                # Copy so a failed enhancement still falls back to the plain chart
+                chart = dict(simple_chart)
+                
                 # Enhance chart with geographical data
                 chart['birth_coordinates'] = {
                     'latitude': coordinates.latitude,
@@ -145,61 +112,85 @@ class PracticalAstrologyCalculator:
                 
                 # Add enhanced interpretations
                 chart['enhanced_interpretations'] = self._generate_enhanced_interpretations(chart)
+                return chart
             
-            return chart
+            return simple_chart
             
         except Exception as e:
-            print(f"Error generating enhanced natal chart: {e}")
-            return self.simple_calc.generate_natal_chart(user)
+            logger.warning("Error generating enhanced natal chart: %s", e)
+            return simple_chart
+    
+    def _simple_chart(self, user) -> Optional[Dict]:
+        """Get a copy of the simplified natal chart, computing it once per birth data"""
+        cache = self._simple_chart_cache
+        key = simple_chart_key(user)
+        try:
+            chart = cache[key]
+            cache.move_to_end(key)
+        except KeyError:
+            chart = self.simple_calc.generate_natal_chart(user)
+            # Failures come back as None and may be transient, so only successes are kept
+            if chart:
+                cache[key] = chart
+                if len(cache) > _SIMPLE_CHART_CACHE_SIZE:
+                    cache.popitem(last=False)  # Evict the least recently used chart
+        
+        # Deep copy so callers can change any part of the chart without touching the cache
+        return copy.deepcopy(chart) if chart else chart
     
     def _generate_enhanced_interpretations(self, chart: Dict) -> Dict:
         """Generate enhanced astrological interpretations"""
         interpretations = {}
         
-        try:
-            if 'positions' in chart:
-                positions = chart['positions']
-                
-                # Sun sign interpretation
-                if 'Sun' in positions:
-                    sun_sign = positions['Sun']['sign']
-                    element = self.sign_elements.get(sun_sign, 'Unknown')
-                    quality = self.sign_qualities.get(sun_sign, 'Unknown')
-                    
-                    interpretations['sun'] = {
-                        'sign': sun_sign,
-                        'element': element,
-                        'quality': quality,
-                        'description': f"Your Sun in {sun_sign} ({element} {quality}) represents your core identity, ego, and life purpose."
-                    }
-                
-                # Moon sign interpretation  
-                if 'Moon' in positions:
-                    moon_sign = positions['Moon']['sign']
-                    element = self.sign_elements.get(moon_sign, 'Unknown')
-                    
-                    interpretations['moon'] = {
-                        'sign': moon_sign,
-                        'element': element,
-                        'description': f"Your Moon in {moon_sign} ({element}) governs your emotional nature, instincts, and subconscious patterns."
-                    }
-                
-                # Rising sign (from first house)
-                if 'houses' in chart and 1 in chart['houses']:
-                    rising_sign = chart['houses'][1]['sign']
-                    element = self.sign_elements.get(rising_sign, 'Unknown')
-                    
-                    interpretations['rising'] = {
-                        'sign': rising_sign,
-                        'element': element,
-                        'description': f"Your Ascendant in {rising_sign} ({element}) shapes how you present yourself to the world and your first impressions."
-                    }
-        
-        except Exception as e:
-            print(f"Error generating enhanced interpretations: {e}")
+        if 'positions' in chart:
+            positions = chart['positions']
+            
+            # Sun sign interpretation
+            if 'Sun' in positions:
+                interpretations['sun'] = self._sign_interp_for('sun', positions['Sun']['sign'])
+            
+            # Moon sign interpretation  
+            if 'Moon' in positions:
+                interpretations['moon'] = self._sign_interp_for('moon', positions['Moon']['sign'])
+            
+            # Rising sign (from first house)
+            if 'houses' in chart and 1 in chart['houses']:
+                interpretations['rising'] = self._sign_interp_for('rising', chart['houses'][1]['sign'])
         
         return interpretations
     
+    def _sign_interp_for(self, point: str, sign: str) -> Dict:
+        """Get the cached sun/moon/rising interpretation for a sign"""
+        key = (point, sign)
+        interpretation = self._interpretation_cache.get(key)
+        if interpretation is not None:
+            return interpretation
+        
+        info = SIGN_TABLE.get(sign, UNKNOWN_SIGN)
+        element, quality = info.element, info.quality
+        if point == 'sun':
+            interpretation = {
+                'sign': sign,
+                'element': element,
+                'quality': quality,
+                'description': f"Your Sun in {sign} ({element} {quality}) represents your core identity, ego, and life purpose."
+            }
+        elif point == 'moon':
+            interpretation = {
+                'sign': sign,
+                'element': element,
+                'description': f"Your Moon in {sign} ({element}) governs your emotional nature, instincts, and subconscious patterns."
+            }
+        else:
+            interpretation = {
+                'sign': sign,
+                'element': element,
+                'description': f"Your Ascendant in {sign} ({element}) shapes how you present yourself to the world and your first impressions."
+            }
+        
+        self._interpretation_cache[key] = interpretation
+        return interpretation
+    
     def get_detailed_chart(self, user) -> Optional[Dict]:
         """Get detailed chart data formatted for template display"""
         chart = self.generate_natal_chart(user)
@@ -222,19 +213,14 @@ class PracticalAstrologyCalculator:
     
     def get_location_info(self, user) -> str:
         """Get formatted location information"""
-        try:
-            if user.birth_city and user.birth_country:
-                parts = [user.birth_city]
-                if user.birth_region:
-                    parts.append(user.birth_region)
-                parts.append(user.birth_country)
-                return ', '.join(parts)
-            elif user.birth_location:
-                return user.birth_location
-            else:
-                return 'Location not specified'
-        except:
-            return 'Location not available'
+        if user.birth_city and user.birth_country:
+            if user.birth_region:
+                return f"{user.birth_city}, {user.birth_region}, {user.birth_country}"
+            return f"{user.birth_city}, {user.birth_country}"
+        elif user.birth_location:
+            return user.birth_location
+        else:
+            return 'Location not specified'
 
 # Summary of current calculator capabilities:
 """
@@ -3,155 +3,176 @@ Professional Astrology Calculator using proper astronomical calculations
 This module integrates the astronomical engine with astrology-specific functionality
 """
 
+import copy
+from collections import OrderedDict
 from datetime import datetime, date, time, timezone
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-import pytz
+import logging
 
-try:
-    from astronomical_engine import NatalChartCalculator, AstronomicalData
-    from astronomical_system import AstronomicalCalculator, GeographicalCoordinate
-    ASTRONOMICAL_ENGINE_AVAILABLE = True
-except ImportError:
-    ASTRONOMICAL_ENGINE_AVAILABLE = False
-    print("Astronomical engine not available, falling back to simplified calculations")
+logger = logging.getLogger(__name__)
+
+# The astronomical engine is heavy to import, so it is loaded on first use by _load_engine()
+NatalChartCalculator = AstronomicalCalculator = GeographicalCoordinate = None
+ASTRONOMICAL_ENGINE_AVAILABLE = None  # Unknown until the first load attempt
+
+def _load_engine() -> bool:
+    """Import the astronomical engine on first call and return whether it is available"""
+    global NatalChartCalculator, AstronomicalCalculator, GeographicalCoordinate, ASTRONOMICAL_ENGINE_AVAILABLE
+    if ASTRONOMICAL_ENGINE_AVAILABLE is None:
+        try:
+            from astronomical_engine import NatalChartCalculator
+            from astronomical_system import AstronomicalCalculator, GeographicalCoordinate
+            ASTRONOMICAL_ENGINE_AVAILABLE = True
+        except ImportError:
+            ASTRONOMICAL_ENGINE_AVAILABLE = False
+            logger.warning("Astronomical engine not available, falling back to simplified calculations")
+    return ASTRONOMICAL_ENGINE_AVAILABLE
 
 from astrology_simple import AstrologyCalculator as SimpleCalculator
+from astrology_common import (
+    register_geocoder, cached_geocode, localize_birth_datetime, simple_chart_key,
+    SIGN_TABLE
+)
+
+# Major aspects: exact angle and allowed orb (in degrees), in match priority order
+_ASPECT_NAMES = ('Conjunction', 'Opposition', 'Trine', 'Square', 'Sextile')
+_ASPECT_EXACT_ANGLES = (0, 180, 120, 90, 60)
+_ASPECT_ORBS = (8, 8, 6, 6, 4)
+
+# Most simplified fallback charts kept per calculator; the least recently used is evicted first
+_SIMPLE_CHART_CACHE_SIZE = 1024
+
+# Planets interpreted around the chart angles, in output order
+_LUMINARIES = ('sun', 'moon')
+_PERSONAL_AND_SOCIAL_PLANETS = ('mercury', 'venus', 'mars', 'jupiter', 'saturn')
+
+# Interpretation description templates for planet placements
+_PLANET_DESCRIPTIONS = {
+    'sun': "Your core identity expresses through {sign} energy in the {house} house area of life.",
+    'moon': "Your emotional nature and instincts operate through {sign} in the {house} house."
+}
+_DEFAULT_PLANET_DESCRIPTION = "Your {planet} energy expresses through {sign} in the {house} house area."
+
+# Interpretation data for chart angles: (label, meaning, description template)
+_ANGLE_INTERPRETATIONS = {
+    'ascendant': (
+        'Ascendant',
+        'How you present yourself to the world, first impressions',
+        "You present yourself to the world with {sign} energy and characteristics."
+    ),
+    'midheaven': (
+        'Midheaven',
+        'Career, reputation, public image, life direction',
+        "Your career and public image are expressed through {sign} qualities."
+    )
+}
 
 class ProfessionalAstrologyCalculator:
     """
     Professional-grade astrology calculator using proper astronomical calculations
     """
     
+    __slots__ = (
+        'house_system', 'natal_calc', 'geo_calc', 'geocoder_id', 'simple_calc',
+        '_placement_cache', '_chart_cache', '_simple_chart_cache'
+    )
+    
+    # Astrological interpretation data
+    PLANET_MEANINGS = {
+        'sun': 'Core identity, ego, life purpose, vitality',
+        'moon': 'Emotions, instincts, subconscious, nurturing',
+        'mercury': 'Communication, thinking, learning, short trips',
+        'venus': 'Love, beauty, values, relationships, money',
+        'mars': 'Action, desire, energy, conflict, motivation',
+        'jupiter': 'Expansion, optimism, philosophy, higher learning',
+        'saturn': 'Discipline, limitation, responsibility, structure'
+    }
+    
+    HOUSE_MEANINGS = {
+        1: 'Self, appearance, first impressions, new beginnings',
+        2: 'Money, possessions, values, self-worth, resources',
+        3: 'Communication, siblings, short trips, early education',
+        4: 'Home, family, roots, foundation, private life',
+        5: 'Creativity, romance, children, self-expression, fun',
+        6: 'Work, health, daily routine, service, pets',
+        7: 'Partnerships, marriage, open enemies, cooperation',
+        8: 'Transformation, shared resources, death/rebirth, occult',
+        9: 'Philosophy, higher education, foreign travel, religion',
+        10: 'Career, reputation, authority, public image, goals',
+        11: 'Friends, groups, hopes, wishes, humanitarian causes',
+        12: 'Spirituality, hidden things, subconscious, karma'
+    }
+    
     def __init__(self, house_system: str = 'Placidus'):
         self.house_system = house_system
         
-        if ASTRONOMICAL_ENGINE_AVAILABLE:
-            self.natal_calc = NatalChartCalculator(house_system)
-            self.geo_calc = AstronomicalCalculator()
-            self.location_cache = {}
+        # Astronomical calculators are created on first use, see _engine_ready
+        self.natal_calc = None
         
         # Always have fallback available
         self.simple_calc = SimpleCalculator()
         
-        # Astrological interpretation data
-        self.planet_meanings = {
-            'sun': 'Core identity, ego, life purpose, vitality',
-            'moon': 'Emotions, instincts, subconscious, nurturing',
-            'mercury': 'Communication, thinking, learning, short trips',
-            'venus': 'Love, beauty, values, relationships, money',
-            'mars': 'Action, desire, energy, conflict, motivation',
-            'jupiter': 'Expansion, optimism, philosophy, higher learning',
-            'saturn': 'Discipline, limitation, responsibility, structure'
-        }
+        # Interpretations are static per placement, so build each one only once
+        self._placement_cache = {}
         
-        self.house_meanings = {
-            1: 'Self, appearance, first impressions, new beginnings',
-            2: 'Money, possessions, values, self-worth, resources',
-            3: 'Communication, siblings, short trips, early education',
-            4: 'Home, family, roots, foundation, private life',
-            5: 'Creativity, romance, children, self-expression, fun',
-            6: 'Work, health, daily routine, service, pets',
-            7: 'Partnerships, marriage, open enemies, cooperation',
-            8: 'Transformation, shared resources, death/rebirth, occult',
-            9: 'Philosophy, higher education, foreign travel, religion',
-            10: 'Career, reputation, authority, public image, goals',
-            11: 'Friends, groups, hopes, wishes, humanitarian causes',
-            12: 'Spirituality, hidden things, subconscious, karma'
-        }
+        # A natal chart never changes for the same birth data, so memoize whole charts.
+        # Keys sit on a display-precision grid (0.01° ~ 1 km, whole minutes) so users
+        # born in the same city and minute share one cached chart
+        self._chart_cache = lru_cache(maxsize=1024)(self._compute_chart)
         
-        self.sign_characteristics = {
-            'Aries': {'element': 'Fire', 'quality': 'Cardinal', 'ruler': 'Mars'},
-            'Taurus': {'element': 'Earth', 'quality': 'Fixed', 'ruler': 'Venus'},
-            'Gemini': {'element': 'Air', 'quality': 'Mutable', 'ruler': 'Mercury'},
-            'Cancer': {'element': 'Water', 'quality': 'Cardinal', 'ruler': 'Moon'},
-            'Leo': {'element': 'Fire', 'quality': 'Fixed', 'ruler': 'Sun'},
-            'Virgo': {'element': 'Earth', 'quality': 'Mutable', 'ruler': 'Mercury'},
-            'Libra': {'element': 'Air', 'quality': 'Cardinal', 'ruler': 'Venus'},
-            'Scorpio': {'element': 'Water', 'quality': 'Fixed', 'ruler': 'Mars'},
-            'Sagittarius': {'element': 'Fire', 'quality': 'Mutable', 'ruler': 'Jupiter'},
-            'Capricorn': {'element': 'Earth', 'quality': 'Cardinal', 'ruler': 'Saturn'},
-            'Aquarius': {'element': 'Air', 'quality': 'Fixed', 'ruler': 'Saturn'},
-            'Pisces': {'element': 'Water', 'quality': 'Mutable', 'ruler': 'Jupiter'}
-        }
+        # Simplified fallback charts keyed by birth data, see _simple_chart
+        self._simple_chart_cache = OrderedDict()
+    
+    def _engine_ready(self) -> bool:
+        """Create the astronomical calculators on first use, if the engine is available"""
+        if self.natal_calc is None:
+            if not _load_engine():
+                return False
+            self.natal_calc = NatalChartCalculator(self.house_system)
+            self.geo_calc = AstronomicalCalculator()
+            self.geocoder_id = register_geocoder(self.geo_calc)
+        return True
     
-    def get_user_coordinates(self, user) -> Optional[GeographicalCoordinate]:
+    def get_user_coordinates(self, user) -> Optional['GeographicalCoordinate']:
         """Get geographical coordinates for user's birth location"""
-        if not ASTRONOMICAL_ENGINE_AVAILABLE:
-            return None
-            
-        try:
-            # Check if coordinates are already stored
-            if user.latitude and user.longitude:
-                return GeographicalCoordinate(
-                    latitude=user.latitude,
-                    longitude=user.longitude,
-                    timezone=user.timezone or 'UTC',
-                    city=user.birth_city or '',
-                    region=user.birth_region or '',
-                    country=user.birth_country or ''
-                )
-            
-            # Try to geocode from location fields
-            if user.birth_country and user.birth_city:
-                cache_key = f"{user.birth_city}-{user.birth_region}-{user.birth_country}".lower()
-                
-                if cache_key in self.location_cache:
-                    return self.location_cache[cache_key]
-                
-                coords = self.geo_calc.get_coordinates_from_location(
-                    city=user.birth_city,
-                    region=user.birth_region,
-                    country=user.birth_country
-                )
-                
-                if coords:
-                    self.location_cache[cache_key] = coords
-                    return coords
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error getting user coordinates: {e}")
+        if not self._engine_ready():
             return None
+        
+        # Check if coordinates are already stored
+        if user.latitude and user.longitude:
+            return GeographicalCoordinate(
+                latitude=user.latitude,
+                longitude=user.longitude,
+                timezone=user.timezone or 'UTC',
+                city=user.birth_city or '',
+                region=user.birth_region or '',
+                country=user.birth_country or ''
+            )
+        
+        # Try to geocode from location fields
+        if user.birth_country and user.birth_city:
+            return cached_geocode(
+                self.geocoder_id,
+                user.birth_country,
+                user.birth_region or '',
+                user.birth_city
+            )
+        
+        return None
     
-    def create_birth_datetime(self, user, coordinates: Optional[GeographicalCoordinate] = None) -> datetime:
+    def create_birth_datetime(self, user, coordinates: Optional['GeographicalCoordinate'] = None) -> datetime:
         """Create proper timezone-aware birth datetime"""
-        try:
-            # Combine date and time
-            birth_time = user.birth_time or time(12, 0)  # Default to noon
-            birth_dt = datetime.combine(user.birth_date, birth_time)
-            
-            # Apply timezone
-            if coordinates and coordinates.timezone:
-                try:
-                    tz = pytz.timezone(coordinates.timezone)
-                    return tz.localize(birth_dt)
-                except:
-                    pass
-            
-            # Try user's timezone setting
-            if user.timezone:
-                try:
-                    if user.timezone.startswith('UTC'):
-                        offset_str = user.timezone[3:]  # Remove 'UTC' prefix
-                        if offset_str:
-                            if ':' in offset_str:
-                                hours, minutes = offset_str.split(':')
-                                offset_hours = float(hours) + float(minutes)/60
-                            else:
-                                offset_hours = float(offset_str)
-                            
-                            tz = pytz.FixedOffset(int(offset_hours * 60))
-                            return tz.localize(birth_dt)
-                except:
-                    pass
-            
-            # Default to UTC
-            return pytz.utc.localize(birth_dt)
-            
-        except Exception as e:
-            print(f"Error creating birth datetime: {e}")
-            return datetime.combine(user.birth_date, birth_time or time(12, 0))
+        if not user.birth_date:
+            raise ValueError("Birth date is required to create a birth datetime")
+        
+        # Unknown zone names and offsets fall back to UTC inside localize_birth_datetime
+        return localize_birth_datetime(
+            user.birth_date,
+            user.birth_time or time(12, 0),  # Default to noon
+            coordinates.timezone if coordinates else None,
+            user.timezone
+        )
     
     def generate_natal_chart(self, user) -> Optional[Dict]:
         """Generate professional natal chart using astronomical calculations"""
@@ -159,122 +180,157 @@ class ProfessionalAstrologyCalculator:
             return None
         
         try:
-            if ASTRONOMICAL_ENGINE_AVAILABLE:
+            if self._engine_ready():
                 # Get coordinates
                 coordinates = self.get_user_coordinates(user)
                 
                 if coordinates:
-                    # Create timezone-aware birth datetime
-                    birth_dt = self.create_birth_datetime(user, coordinates)
-                    
-                    # Perform astronomical calculations
-                    astro_data = self.natal_calc.calculate_natal_chart(
-                        birth_dt=birth_dt,
-                        latitude=coordinates.latitude,
-                        longitude=coordinates.longitude
+                    birth_time = user.birth_time or time(12, 0)  # Default to noon
+                    cached = self._chart_cache(
+                        user.birth_date.isoformat(),
+                        birth_time.replace(second=0, microsecond=0).isoformat(),
+                        round(coordinates.latitude, 2),
+                        round(coordinates.longitude, 2),
+                        coordinates.timezone,
+                        user.timezone,
+                        self.house_system
                     )
                     
-                    # Format chart data
-                    chart_data = self.natal_calc.format_chart_data(astro_data)
-                    
-                    # Add metadata
-                    chart_data['birth_info'] = {
-                        'datetime': birth_dt,
-                        'coordinates': coordinates,
-                        'house_system': self.house_system,
-                        'calculation_method': 'Professional Astronomical'
-                    }
-                    
-                    # Add interpretations
-                    chart_data['interpretations'] = self._generate_professional_interpretations(chart_data)
-                    
+                    # Deep copy so callers can change any part of the chart, and
+                    # per-call metadata never leaks into the cache; still far cheaper
+                    # than recomputing the chart
+                    chart_data = copy.deepcopy(cached)
+                    chart_data['birth_info']['coordinates'] = coordinates
                     return chart_data
             
             # Fallback to simple calculations
-            print("Using simplified calculations as fallback")
-            return self.simple_calc.generate_natal_chart(user)
+            logger.info("Using simplified calculations as fallback")
             
         except Exception as e:
-            print(f"Error generating professional natal chart: {e}")
-            # Always fallback to simple calculations
-            return self.simple_calc.generate_natal_chart(user)
+            logger.warning("Error generating professional natal chart: %s", e)
+        
+        # Always fallback to simple calculations
+        return self._simple_chart(user)
+    
+    def _simple_chart(self, user) -> Optional[Dict]:
+        """Get a copy of the simplified fallback chart, computing it once per birth data"""
+        cache = self._simple_chart_cache
+        key = simple_chart_key(user)
+        try:
+            chart = cache[key]
+            cache.move_to_end(key)
+        except KeyError:
+            chart = self.simple_calc.generate_natal_chart(user)
+            # Failures come back as None and may be transient, so only successes are kept
+            if chart:
+                cache[key] = chart
+                if len(cache) > _SIMPLE_CHART_CACHE_SIZE:
+                    cache.popitem(last=False)  # Evict the least recently used chart
+        
+        # Deep copy so callers can change any part of the chart without touching the cache
+        return copy.deepcopy(chart) if chart else chart
+    
+    def _compute_chart(self, birth_date_iso: str, birth_time_iso: str, lat: float, lon: float,
+                       tz_name: Optional[str], user_timezone: Optional[str], house_system: str) -> Dict:
+        """Calculate a natal chart from hashable birth data (memoized via self._chart_cache)"""
+        # Create timezone-aware birth datetime
+        birth_dt = localize_birth_datetime(
+            date.fromisoformat(birth_date_iso),
+            time.fromisoformat(birth_time_iso),
+            tz_name,
+            user_timezone
+        )
+        
+        # Perform astronomical calculations
+        astro_data = self.natal_calc.calculate_natal_chart(
+            birth_dt=birth_dt,
+            latitude=lat,
+            longitude=lon
+        )
+        
+        # Format chart data
+        chart_data = self.natal_calc.format_chart_data(astro_data)
+        
+        # Add metadata (coordinates are attached per call by generate_natal_chart)
+        chart_data['birth_info'] = {
+            'datetime': birth_dt,
+            'house_system': house_system,
+            'calculation_method': 'Professional Astronomical'
+        }
+        
+        # Add interpretations and aspects so neither is recomputed on a cache hit
+        chart_data['interpretations'] = self._generate_professional_interpretations(chart_data)
+        chart_data['aspects'] = self.calculate_aspects(chart_data)
+        
+        return chart_data
     
     def _generate_professional_interpretations(self, chart_data: Dict) -> Dict:
         """Generate professional astrological interpretations"""
         interpretations = {}
         
-        try:
-            planets = chart_data.get('planets', {})
-            houses = chart_data.get('houses', {})
-            
-            # Big Three interpretations
-            if 'sun' in planets:
-                sun_data = planets['sun']
-                sign_info = self.sign_characteristics.get(sun_data['sign'], {})
-                
-                interpretations['sun'] = {
-                    'placement': f"Sun in {sun_data['sign']} in House {sun_data['house']}",
-                    'sign_info': sign_info,
-                    'meaning': self.planet_meanings['sun'],
-                    'house_meaning': self.house_meanings.get(sun_data['house'], ''),
-                    'description': f"Your core identity expresses through {sun_data['sign']} energy in the {sun_data['house']} house area of life."
-                }
-            
-            if 'moon' in planets:
-                moon_data = planets['moon']
-                sign_info = self.sign_characteristics.get(moon_data['sign'], {})
-                
-                interpretations['moon'] = {
-                    'placement': f"Moon in {moon_data['sign']} in House {moon_data['house']}",
-                    'sign_info': sign_info,
-                    'meaning': self.planet_meanings['moon'],
-                    'house_meaning': self.house_meanings.get(moon_data['house'], ''),
-                    'description': f"Your emotional nature and instincts operate through {moon_data['sign']} in the {moon_data['house']} house."
-                }
-            
-            # Rising sign (Ascendant)
-            if 1 in houses:
-                asc_sign = houses[1]['sign']
-                sign_info = self.sign_characteristics.get(asc_sign, {})
-                
-                interpretations['ascendant'] = {
-                    'placement': f"Ascendant in {asc_sign}",
-                    'sign_info': sign_info,
-                    'meaning': 'How you present yourself to the world, first impressions',
-                    'description': f"You present yourself to the world with {asc_sign} energy and characteristics."
-                }
-            
-            # Midheaven
-            if 10 in houses:
-                mc_sign = houses[10]['sign']
-                sign_info = self.sign_characteristics.get(mc_sign, {})
-                
-                interpretations['midheaven'] = {
-                    'placement': f"Midheaven in {mc_sign}",
-                    'sign_info': sign_info,
-                    'meaning': 'Career, reputation, public image, life direction',
-                    'description': f"Your career and public image are expressed through {mc_sign} qualities."
-                }
-            
-            # Other planets
-            for planet in ['mercury', 'venus', 'mars', 'jupiter', 'saturn']:
-                if planet in planets:
-                    planet_data = planets[planet]
-                    sign_info = self.sign_characteristics.get(planet_data['sign'], {})
-                    
-                    interpretations[planet] = {
-                        'placement': f"{planet.title()} in {planet_data['sign']} in House {planet_data['house']}",
-                        'sign_info': sign_info,
-                        'meaning': self.planet_meanings.get(planet, ''),
-                        'house_meaning': self.house_meanings.get(planet_data['house'], ''),
-                        'description': f"Your {planet} energy expresses through {planet_data['sign']} in the {planet_data['house']} house area."
-                    }
-            
-        except Exception as e:
-            print(f"Error generating interpretations: {e}")
+        planets = chart_data.get('planets', {})
+        houses = chart_data.get('houses', {})
+        build = self._build_planet_interp
+        
+        # Big Three interpretations
+        for planet in _LUMINARIES:
+            if planet in planets:
+                interpretations[planet] = build(planet, planets[planet])
+        
+        # Rising sign (Ascendant)
+        if 1 in houses:
+            interpretations['ascendant'] = self._angle_interp_for('ascendant', houses[1]['sign'])
+        
+        # Midheaven
+        if 10 in houses:
+            interpretations['midheaven'] = self._angle_interp_for('midheaven', houses[10]['sign'])
+        
+        # Other planets
+        for planet in _PERSONAL_AND_SOCIAL_PLANETS:
+            if planet in planets:
+                interpretations[planet] = build(planet, planets[planet])
         
         return interpretations
     
+    def _build_planet_interp(self, planet: str, planet_data: Dict) -> Dict:
+        """Get the interpretation for a planet from its chart entry"""
+        return self._interp_for(planet, planet_data['sign'], planet_data['house'])
+    
+    def _interp_for(self, planet: str, sign: str, house) -> Dict:
+        """Get the cached interpretation for a planet in a sign and house"""
+        key = (planet, sign, house)
+        interpretation = self._placement_cache.get(key)
+        if interpretation is None:
+            template = _PLANET_DESCRIPTIONS.get(planet, _DEFAULT_PLANET_DESCRIPTION)
+            interpretation = self._placement_cache[key] = {
+                'placement': f"{planet.title()} in {sign} in House {house}",
+                'sign_info': self._sign_info(sign),
+                'meaning': self.PLANET_MEANINGS.get(planet, ''),
+                'house_meaning': self.HOUSE_MEANINGS.get(house, ''),
+                'description': template.format(planet=planet, sign=sign, house=house)
+            }
+        return interpretation
+    
+    def _angle_interp_for(self, angle: str, sign: str) -> Dict:
+        """Get the cached interpretation for a chart angle (ascendant/midheaven) in a sign"""
+        key = (angle, sign, None)
+        interpretation = self._placement_cache.get(key)
+        if interpretation is None:
+            label, meaning, template = _ANGLE_INTERPRETATIONS[angle]
+            interpretation = self._placement_cache[key] = {
+                'placement': f"{label} in {sign}",
+                'sign_info': self._sign_info(sign),
+                'meaning': meaning,
+                'description': template.format(sign=sign)
+            }
+        return interpretation
+    
+    @staticmethod
+    def _sign_info(sign: str) -> Dict:
+        """Get element, quality and ruler of a sign as a dict, or {} for an unknown sign"""
+        info = SIGN_TABLE.get(sign)
+        return info._asdict() if info else {}
+    
     def get_detailed_chart(self, user) -> Optional[Dict]:
         """Get detailed chart data formatted for template display"""
         chart = self.generate_natal_chart(user)
@@ -289,49 +345,37 @@ class ProfessionalAstrologyCalculator:
     
     def calculate_aspects(self, chart_data: Dict) -> List[Dict]:
         """Calculate major aspects between planets"""
-        aspects = []
+        # numpy is only needed here, so importing the calculator does not pay for it
+        import numpy as np
         
-        try:
-            planets = chart_data.get('planets', {})
-            planet_names = list(planets.keys())
-            
-            # Major aspects and their degrees
-            major_aspects = {
-                'Conjunction': (0, 8),      # 0° ± 8°
-                'Opposition': (180, 8),     # 180° ± 8°
-                'Trine': (120, 6),          # 120° ± 6°
-                'Square': (90, 6),          # 90° ± 6°
-                'Sextile': (60, 4),         # 60° ± 4°
-            }
-            
-            # Calculate aspects between all planet pairs
-            for i, planet1 in enumerate(planet_names):
-                for planet2 in planet_names[i+1:]:
-                    lng1 = planets[planet1]['longitude']
-                    lng2 = planets[planet2]['longitude']
-                    
-                    # Calculate angular difference
-                    diff = abs(lng1 - lng2)
-                    if diff > 180:
-                        diff = 360 - diff
-                    
-                    # Check for major aspects
-                    for aspect_name, (target_angle, orb) in major_aspects.items():
-                        if abs(diff - target_angle) <= orb:
-                            aspects.append({
-                                'planet1': planet1,
-                                'planet2': planet2,
-                                'aspect': aspect_name,
-                                'angle': diff,
-                                'orb': abs(diff - target_angle),
-                                'exact_angle': target_angle
-                            })
-                            break
-            
-        except Exception as e:
-            print(f"Error calculating aspects: {e}")
+        planets = chart_data.get('planets', {})
+        # Names and longitudes in one pass, without re-indexing planets by name
+        planet_names = tuple(planets)
+        longitudes = np.fromiter(
+            (planet['longitude'] for planet in planets.values()),
+            dtype=np.float64, count=len(planet_names)
+        )
+        
+        # Pairwise angular separations, folded into 0-180°
+        diff = np.abs(longitudes[:, None] - longitudes[None, :])
+        diff = np.minimum(diff, 360.0 - diff)
         
-        return aspects
+        # Orb from every aspect angle for every pair; keep each pair once (upper triangle)
+        orbs = np.abs(diff[:, :, None] - np.array(_ASPECT_EXACT_ANGLES, dtype=np.float64))
+        hits = (orbs <= np.array(_ASPECT_ORBS, dtype=np.float64)) & np.triu(np.ones_like(diff, dtype=bool), k=1)[:, :, None]
+        
+        # Aspect windows never overlap, so each pair matches at most one aspect
+        return [
+            {
+                'planet1': planet_names[i],
+                'planet2': planet_names[j],
+                'aspect': _ASPECT_NAMES[a],
+                'angle': float(diff[i, j]),
+                'orb': float(orbs[i, j, a]),
+                'exact_angle': _ASPECT_EXACT_ANGLES[a]
+            }
+            for i, j, a in np.argwhere(hits).tolist()
+        ]
 
 # Status and capabilities summary:
 """
@@ -12,12 +12,70 @@ This module creates professional-quality natal charts following traditional
 astrological chart conventions without requiring external astrology libraries.
 """
 
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.transforms import Bbox
 import numpy as np
 import io
 import base64
-from math import cos, sin, radians, degrees, atan2
+import threading
+from PIL import Image
+
+# Major aspects: target angle and orb (in degrees), plus the line style used for each
+# Targets are sorted and their orbs never overlap, so only the nearest target can match
+_ASPECT_TARGETS = np.array([0, 60, 90, 120, 180], dtype=float)  # conjunction, sextile, square, trine, opposition
+_ASPECT_ORBS = np.array([8, 4, 6, 6, 8], dtype=float)
+_ASPECT_STYLES = tuple(to_rgba(color, alpha) for color, alpha in (
+    ('#E74C3C', 0.6), ('#27AE60', 0.5), ('#E67E22', 0.5), ('#3498DB', 0.4)
+))
+_ASPECT_STYLE_INDEX = np.array([0, 3, 2, 1, 0])  # conjunction and opposition share a style
+
+# Colors parsed once to RGBA so drawing never goes through the color string parser
+_LABEL_RGBA = to_rgba('#2C3E50')
+_CUSP_RGBA = to_rgba('#3498DB')
+
+# Data URI prefixes of the returned chart images
+_PNG_URI_PREFIX = 'data:image/png;base64,'
+_SVG_URI_PREFIX = 'data:image/svg+xml;base64,'
+
+# Chart data figure reused across charts; matplotlib figures are not thread-safe
+_FIGURE_LOCK = threading.Lock()
+_FIG = None
+_AX = None
+
+def _get_chart_axes(width, height, dpi):
+    """Get the shared chart figure and an emptied axes, sized to width x height inches."""
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG = Figure(figsize=(width, height), dpi=dpi, facecolor='none')
+        FigureCanvasAgg(_FIG)
+        _AX = _FIG.subplots()
+    elif tuple(_FIG.get_size_inches()) != (width, height):
+        _FIG.set_size_inches(width, height)
+    # Only drop the previous chart's artists; ax.clear() would also rebuild
+    # the hidden ticks and spines, which costs more than drawing the planets
+    for artist in (*_AX.lines, *_AX.patches, *_AX.collections, *_AX.texts):
+        artist.remove()
+    return _FIG, _AX
+
+def _extract_longitude(planet_data):
+    """Get a planet's longitude from a dict, a bare number or an object with attributes"""
+    # Calculator output is a dict, so try that first and only fall back on failure;
+    # numpy scalars raise IndexError when subscripted with a string
+    try:
+        return planet_data['longitude']
+    except (KeyError, IndexError, TypeError):
+        pass
+    try:
+        return planet_data['position']
+    except (KeyError, IndexError, TypeError):
+        pass
+    if isinstance(planet_data, (int, float)):
+        return planet_data
+    return getattr(planet_data, 'longitude', getattr(planet_data, 'position', 0))
 
 class ProfessionalAstrologyChart:
     """
@@ -31,18 +89,29 @@ class ProfessionalAstrologyChart:
     - Clean, readable design for web embedding
     """
     
+    # Output resolution, shared by the cached background and the saved image
+    DPI = 150
+    
+    # Pre-rendered static layers (circles, zodiac wheel, copyright) keyed on (width, height, dpi):
+    # (RGB array of the cropped image, (top, bottom, left, right) crop box in canvas pixels)
+    _BG_CACHE = {}
+    
+    # Unit-circle (cos, sin) of each sign boundary; Aries at 0° starts from the top
+    _ZODIAC_CS = np.column_stack([np.cos(np.radians(90 - np.arange(12) * 30)),
+                                  np.sin(np.radians(90 - np.arange(12) * 30))])
+    
     def __init__(self):
         self.zodiac_symbols = ['♈', '♉', '♊', '♋', '♌', '♍', '♎', '♏', '♐', '♑', '♒', '♓']
         self.zodiac_names = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo', 
                            'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
         
-        # Professional astrology colors
-        self.zodiac_colors = {
+        # Professional astrology colors, as RGBA tuples
+        self.zodiac_colors = {element: to_rgba(color) for element, color in {
             'fire': '#E74C3C',     # Aries, Leo, Sagittarius
             'earth': '#8E44AD',    # Taurus, Virgo, Capricorn  
             'air': '#3498DB',      # Gemini, Libra, Aquarius
             'water': '#27AE60'     # Cancer, Scorpio, Pisces
-        }
+        }.items()}
         
         self.element_cycle = ['fire', 'earth', 'air', 'water'] * 3
         
@@ -58,46 +127,92 @@ class ProfessionalAstrologyChart:
             'neptune': {'symbol': '♆', 'color': '#9B59B6', 'size': 14, 'name': 'Neptune'},
             'pluto': {'symbol': '♇', 'color': '#34495E', 'size': 12, 'name': 'Pluto'}
         }
+        for info in self.planet_info.values():
+            info['color'] = to_rgba(info['color'])
     
-    def create_natal_chart(self, chart_data, width=10, height=10):
+    def create_natal_chart(self, chart_data, width=10, height=10, chart_format='svg'):
         """
         Create a professional natal chart from enhanced calculator data.
         
         Args:
             chart_data: Dictionary from Enhanced Professional Calculator
             width, height: Chart dimensions in inches
+            chart_format: 'svg' for a vector image, 'png' for a raster one
             
         Returns:
-            Base64 encoded PNG image string
+            Base64 encoded SVG or PNG image data URI
         """
         try:
-            # Use non-interactive backend
-            plt.switch_backend('Agg')
+            background = self._get_background(width, height)
             
-            # Create figure with professional proportions
-            fig, ax = plt.subplots(figsize=(width, height), facecolor='white')
-            ax.set_xlim(-1.3, 1.3)
-            ax.set_ylim(-1.3, 1.3)
-            ax.set_aspect('equal')
-            ax.axis('off')
-            ax.set_facecolor('white')
+            with _FIGURE_LOCK:
+                # For PNG the shared figure only holds the chart data and is
+                # composited over the cached static wheel when saved
+                fig, ax = _get_chart_axes(width, height, self.DPI)
+                self._setup_axes(ax)
+                
+                if chart_format == 'svg':
+                    # Vector output has no raster to composite over, so draw the wheel too
+                    self._draw_chart_circles(ax)
+                    self._draw_zodiac_wheel(ax)
+                    self._add_copyright(ax)
+                
+                # Draw chart data
+                self._draw_house_cusps(ax, chart_data.get('houses', []))
+                self._draw_planets(ax, chart_data.get('planets', {}))
+                self._draw_aspects(ax, chart_data.get('planets', {}))
+                
+                # Save to base64
+                if chart_format == 'svg':
+                    return self._save_svg_to_base64(fig, background)
+                return self._save_to_base64(fig, background)
             
-            # Draw chart structure
+        except Exception as e:
+            print(f"Professional chart generation error: {e}")
+            return None
+    
+    def _setup_axes(self, ax):
+        """Set the chart coordinate system and hide the axes."""
+        ax.set_xlim(-1.3, 1.3)
+        ax.set_ylim(-1.3, 1.3)
+        ax.set_aspect('equal')
+        ax.axis('off')
+        ax.set_facecolor('white')
+    
+    def _get_background(self, width, height):
+        """Get the static chart layers and their crop box, rendering them once per size."""
+        key = (width, height, self.DPI)
+        background = self._BG_CACHE.get(key)
+        if background is None:
+            # Off-screen figure laid out exactly like the chart figure
+            fig = Figure(figsize=(width, height), dpi=self.DPI, facecolor='white')
+            FigureCanvasAgg(fig)
+            ax = fig.subplots()
+            self._setup_axes(ax)
             self._draw_chart_circles(ax)
             self._draw_zodiac_wheel(ax)
-            self._draw_house_cusps(ax, chart_data.get('houses', []))
-            self._draw_planets(ax, chart_data.get('planets', {}))
-            self._draw_aspects(ax, chart_data.get('planets', {}))
-            
-            # Add copyright notice
             self._add_copyright(ax)
+            fig.canvas.draw()
             
-            # Save to base64
-            return self._save_to_base64(fig)
-            
-        except Exception as e:
-            print(f"Professional chart generation error: {e}")
-            return None
+            # Same crop as savefig(bbox_inches='tight', pad_inches=0.1); chart data always
+            # falls inside the wheel, so the static layers alone decide the bounds
+            bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+            rgba = np.asarray(fig.canvas.buffer_rgba())
+            rows, cols = rgba.shape[:2]
+            top = max(0, rows - int(round(bbox.y1 * self.DPI)))
+            bottom = min(rows, rows - int(round(bbox.y0 * self.DPI)))
+            left = max(0, int(round(bbox.x0 * self.DPI)))
+            right = min(cols, int(round(bbox.x1 * self.DPI)))
+            crop = (top, bottom, left, right)
+            background = (rgba[top:bottom, left:right, :3].copy(), crop)
+            self._BG_CACHE[key] = background
+        return background
+    
+    @staticmethod
+    def _cs(longitudes):
+        """Get the unit-circle (cos, sin) of chart positions for ecliptic longitudes in degrees."""
+        angles = np.radians(90 - np.asarray(longitudes, dtype=float))
+        return np.cos(angles), np.sin(angles)
     
     def _draw_chart_circles(self, ax):
         """Draw the main chart circles with professional styling."""
@@ -118,29 +233,26 @@ class ProfessionalAstrologyChart:
     
     def _draw_zodiac_wheel(self, ax):
         """Draw zodiac signs with traditional positioning."""
-        for i, (symbol, element) in enumerate(zip(self.zodiac_symbols, self.element_cycle)):
-            # Calculate position (Aries at 0°, moving counterclockwise)
-            angle_deg = i * 30  # Each sign is 30 degrees
-            angle_rad = radians(90 - angle_deg)  # Start from top, move clockwise
-            
-            # Position symbol
-            radius = 1.12
-            x = radius * cos(angle_rad)
-            y = radius * sin(angle_rad)
-            
+        # Sign boundaries: Aries at 0°, each sign is 30 degrees, starting from top
+        c, s = self._ZODIAC_CS.T
+        
+        # Position symbols
+        radius = 1.12
+        for symbol, element, x, y in zip(self.zodiac_symbols, self.element_cycle, radius * c, radius * s):
             color = self.zodiac_colors[element]
             ax.text(x, y, symbol, fontsize=18, ha='center', va='center',
                    color=color, weight='bold', family='serif')
-            
-            # Draw degree markers for sign boundaries
-            inner_radius = 0.95
-            outer_radius = 1.0
-            x1 = inner_radius * cos(angle_rad)
-            y1 = inner_radius * sin(angle_rad)
-            x2 = outer_radius * cos(angle_rad)
-            y2 = outer_radius * sin(angle_rad)
-            
-            ax.plot([x1, x2], [y1, y2], color='#2C3E50', linewidth=1, alpha=0.6)
+        
+        # Draw degree markers for sign boundaries as one collection
+        inner_radius = 0.95
+        outer_radius = 1.0
+        segments = np.stack([
+            np.stack([inner_radius * c, inner_radius * s], axis=1),
+            np.stack([outer_radius * c, outer_radius * s], axis=1)
+        ], axis=1)
+        # Projecting caps and line zorder keep the look of the former ax.plot lines
+        ax.add_collection(LineCollection(segments, colors=[_LABEL_RGBA], linewidths=1, alpha=0.6,
+                                         capstyle='projecting', zorder=2))
     
     def _draw_house_cusps(self, ax, houses):
         """Draw house cusps with traditional lines."""
@@ -163,142 +275,88 @@ class ProfessionalAstrologyChart:
         # Draw main angles (1st, 4th, 7th, 10th houses) with thicker lines
         main_angles = [0, 3, 6, 9]  # ASC, IC, DSC, MC
         
-        for i, cusp_deg in enumerate(house_cusps):
-            if cusp_deg is None:
-                continue
-                
-            angle_rad = radians(90 - cusp_deg)
-            
-            # Line from center to house circle
-            x1, y1 = 0, 0
-            x2 = 0.75 * cos(angle_rad)
-            y2 = 0.75 * sin(angle_rad)
-            
-            # Thicker lines for main angles
-            linewidth = 2 if i in main_angles else 1
-            alpha = 0.8 if i in main_angles else 0.5
-            
-            ax.plot([x1, x2], [y1, y2], color='#3498DB', 
-                   linewidth=linewidth, alpha=alpha)
-            
-            # House numbers
-            label_radius = 0.85
-            x_label = label_radius * cos(angle_rad + radians(15))
-            y_label = label_radius * sin(angle_rad + radians(15))
+        # Keep each cusp's house index so missing cusps don't shift the numbering
+        indices = np.array([i for i, cusp_deg in enumerate(house_cusps) if cusp_deg is not None], dtype=int)
+        if not len(indices):
+            return
+        cusps = np.array([house_cusps[i] for i in indices], dtype=float)
+        c, s = self._cs(cusps)
+        is_main = np.isin(indices, main_angles)
+        
+        # Lines from center to house circle, all in one collection
+        ends = 0.75 * np.stack([c, s], axis=1)
+        segments = np.stack([np.zeros_like(ends), ends], axis=1)
+        colors = np.tile(_CUSP_RGBA, (len(indices), 1))
+        colors[:, 3] = np.where(is_main, 0.8, 0.5)
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=np.where(is_main, 2, 1),
+                                         capstyle='projecting', zorder=2))
+        
+        # House numbers
+        label_radius = 0.85
+        label_c, label_s = self._cs(cusps - 15)
+        for i, main, x_label, y_label in zip(indices, is_main, label_radius * label_c, label_radius * label_s):
             ax.text(x_label, y_label, str(i + 1), fontsize=10, 
-                   ha='center', va='center', color='#2C3E50',
-                   weight='bold' if i in main_angles else 'normal')
+                   ha='center', va='center', color=_LABEL_RGBA,
+                   weight='bold' if main else 'normal')
     
     def _draw_planets(self, ax, planets):
         """Draw planets with professional symbols and positioning."""
         if not planets:
             return
             
-        for planet_name, planet_data in planets.items():
-            planet_key = planet_name.lower()
-            if planet_key not in self.planet_info:
-                continue
-                
-            info = self.planet_info[planet_key]
-            
-            # Get longitude
-            longitude = 0
-            if isinstance(planet_data, dict):
-                longitude = planet_data.get('longitude', planet_data.get('position', 0))
-            elif isinstance(planet_data, (int, float)):
-                longitude = planet_data
-            else:
-                longitude = getattr(planet_data, 'longitude', 
-                                  getattr(planet_data, 'position', 0))
-            
-            # Calculate position
-            angle_rad = radians(90 - longitude)
-            radius = 0.82
-            x = radius * cos(angle_rad)
-            y = radius * sin(angle_rad)
-            
+        # Planets we have symbols for, with all positions computed in one pass
+        drawn = [(self.planet_info[name.lower()], _extract_longitude(data))
+                 for name, data in planets.items() if name.lower() in self.planet_info]
+        if not drawn:
+            return
+        c, s = self._cs([longitude for _, longitude in drawn])
+        
+        ax_text = ax.text
+        for (info, longitude), x, y, x_deg, y_deg in zip(drawn, 0.82 * c, 0.82 * s, 0.65 * c, 0.65 * s):
             # Draw planet symbol
-            ax.text(x, y, info['symbol'], fontsize=info['size'], 
-                   ha='center', va='center', color=info['color'], 
-                   weight='bold', family='serif')
+            ax_text(x, y, info['symbol'], fontsize=info['size'], 
+                    ha='center', va='center', color=info['color'], 
+                    weight='bold', family='serif')
             
             # Add degree label
-            degree_text = f"{longitude:.0f}°"
-            degree_radius = 0.65
-            x_deg = degree_radius * cos(angle_rad)
-            y_deg = degree_radius * sin(angle_rad)
-            ax.text(x_deg, y_deg, degree_text, fontsize=8, 
-                   ha='center', va='center', color='#2C3E50', 
-                   alpha=0.7)
+            ax_text(x_deg, y_deg, f"{longitude:.0f}°", fontsize=8, 
+                    ha='center', va='center', color=_LABEL_RGBA, 
+                    alpha=0.7)
     
     def _draw_aspects(self, ax, planets):
         """Draw major aspects between planets."""
         if not planets or len(planets) < 2:
             return
             
-        # Major aspects and their colors
-        aspects = {
-            'conjunction': {'orb': 8, 'color': '#E74C3C', 'alpha': 0.6},
-            'opposition': {'orb': 8, 'color': '#E74C3C', 'alpha': 0.6},
-            'trine': {'orb': 6, 'color': '#27AE60', 'alpha': 0.5},
-            'square': {'orb': 6, 'color': '#E67E22', 'alpha': 0.5},
-            'sextile': {'orb': 4, 'color': '#3498DB', 'alpha': 0.4}
-        }
+        lons = np.array([_extract_longitude(planet_data) for planet_name, planet_data in planets.items()
+                         if planet_name.lower() in self.planet_info], dtype=float)
+        if len(lons) < 2:
+            return
         
-        planet_positions = {}
-        for planet_name, planet_data in planets.items():
-            if planet_name.lower() in self.planet_info:
-                longitude = 0
-                if isinstance(planet_data, dict):
-                    longitude = planet_data.get('longitude', planet_data.get('position', 0))
-                elif isinstance(planet_data, (int, float)):
-                    longitude = planet_data
-                else:
-                    longitude = getattr(planet_data, 'longitude', 
-                                      getattr(planet_data, 'position', 0))
-                planet_positions[planet_name] = longitude
+        # Angular separation of each pair, folded into 0-180°
+        pair_i, pair_j = np.triu_indices(len(lons), k=1)
+        diff = np.abs(lons[pair_i] - lons[pair_j])
+        diff = np.minimum(diff, 360 - diff)
         
-        # Check for aspects between planets
-        planet_names = list(planet_positions.keys())
-        for i, planet1 in enumerate(planet_names):
-            for planet2 in planet_names[i+1:]:
-                lon1 = planet_positions[planet1]
-                lon2 = planet_positions[planet2]
-                
-                # Calculate angular separation
-                diff = abs(lon1 - lon2)
-                if diff > 180:
-                    diff = 360 - diff
-                
-                # Check for major aspects
-                aspect_found = None
-                if diff <= aspects['conjunction']['orb']:
-                    aspect_found = 'conjunction'
-                elif abs(diff - 180) <= aspects['opposition']['orb']:
-                    aspect_found = 'opposition'
-                elif abs(diff - 120) <= aspects['trine']['orb']:
-                    aspect_found = 'trine'
-                elif abs(diff - 90) <= aspects['square']['orb']:
-                    aspect_found = 'square'
-                elif abs(diff - 60) <= aspects['sextile']['orb']:
-                    aspect_found = 'sextile'
-                
-                if aspect_found:
-                    # Draw aspect line
-                    angle1 = radians(90 - lon1)
-                    angle2 = radians(90 - lon2)
-                    radius = 0.3
-                    
-                    x1 = radius * cos(angle1)
-                    y1 = radius * sin(angle1)
-                    x2 = radius * cos(angle2)
-                    y2 = radius * sin(angle2)
-                    
-                    aspect_style = aspects[aspect_found]
-                    ax.plot([x1, x2], [y1, y2], 
-                           color=aspect_style['color'],
-                           alpha=aspect_style['alpha'],
-                           linewidth=1)
+        # Nearest aspect target of each pair, then a single orb test against it
+        upper = np.clip(np.searchsorted(_ASPECT_TARGETS, diff), 1, len(_ASPECT_TARGETS) - 1)
+        nearest = np.where(diff - _ASPECT_TARGETS[upper - 1] <= _ASPECT_TARGETS[upper] - diff, upper - 1, upper)
+        hits = np.abs(diff - _ASPECT_TARGETS[nearest]) <= _ASPECT_ORBS[nearest]
+        if not hits.any():
+            return
+        pair_i, pair_j, aspect_idx = pair_i[hits], pair_j[hits], nearest[hits]
+        
+        # Aspect line endpoints on the inner circle
+        points = 0.3 * np.column_stack(self._cs(lons))
+        segments = np.stack([points[pair_i], points[pair_j]], axis=1)
+        
+        # One collection per aspect style instead of one line per aspect
+        style_idx = _ASPECT_STYLE_INDEX[aspect_idx]
+        for k, color in enumerate(_ASPECT_STYLES):
+            mask = style_idx == k
+            if mask.any():
+                ax.add_collection(LineCollection(segments[mask], colors=[color], linewidths=1,
+                                                 capstyle='projecting', zorder=2))
     
     def _add_copyright(self, ax):
         """Add copyright and attribution notice."""
@@ -311,20 +369,40 @@ class ProfessionalAstrologyChart:
                ha='left', va='bottom', color='#7F8C8D', 
                alpha=0.7, style='italic')
     
-    def _save_to_base64(self, fig):
-        """Save figure to base64 string."""
+    def _save_to_base64(self, fig, background):
+        """Composite the figure over the static background and save it to a base64 string."""
+        background_rgb, (top, bottom, left, right) = background
+        fig.canvas.draw()
+        layer = np.asarray(fig.canvas.buffer_rgba())[top:bottom, left:right]
+        
+        # Source-over blend of the transparent chart layer onto the opaque background
+        alpha = layer[..., 3:].astype(np.uint16)
+        composed = (layer[..., :3] * alpha + background_rgb * (255 - alpha) + 127) // 255
+        
+        # A lower compression level than Pillow's default 6 cuts encode time by
+        # about a third for a slightly larger file
+        img_buffer = io.BytesIO()
+        Image.fromarray(composed.astype(np.uint8)).save(img_buffer, 'PNG', dpi=(self.DPI, self.DPI),
+                                                        compress_level=3)
+        # getbuffer() encodes the PNG in place instead of copying it out first
+        return _PNG_URI_PREFIX + base64.b64encode(img_buffer.getbuffer()).decode('ascii')
+    
+    def _save_svg_to_base64(self, fig, background):
+        """Save the figure as SVG, cropped like the PNG, to a base64 string."""
+        # Reuse the PNG crop box instead of savefig's tight-bbox pass, which
+        # would render the whole SVG once just to measure it
+        _, (top, bottom, left, right) = background
+        height = fig.bbox.height
+        crop = Bbox.from_extents(left, height - bottom, right, height - top).transformed(fig.dpi_scale_trans.inverted())
+        
         img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, 
-                   bbox_inches='tight', facecolor='white', 
-                   edgecolor='none', pad_inches=0.1)
-        img_buffer.seek(0)
-        img_data = base64.b64encode(img_buffer.getvalue()).decode()
-        plt.close(fig)
-        return f"data:image/png;base64,{img_data}"
+        fig.savefig(img_buffer, format='svg', bbox_inches=crop, facecolor='white')
+        # getbuffer() encodes the SVG in place instead of copying it out first
+        return _SVG_URI_PREFIX + base64.b64encode(img_buffer.getbuffer()).decode('ascii')
 
 
 # Factory function for easy integration
-def create_professional_chart(chart_data, accuracy_level="Professional"):
+def create_professional_chart(chart_data, accuracy_level="Professional", chart_format="svg"):
     """
     Create a professional natal chart using Enhanced Professional Calculator data.
     
@@ -334,9 +412,10 @@ def create_professional_chart(chart_data, accuracy_level="Professional"):
     Args:
         chart_data: Dictionary from Enhanced Professional Calculator
         accuracy_level: Chart detail level (maintained for compatibility)
+        chart_format: 'svg' (default) or 'png'
         
     Returns:
-        Base64 encoded PNG image string
+        Base64 encoded SVG or PNG image data URI
     """
     chart_generator = ProfessionalAstrologyChart()
-    return chart_generator.create_natal_chart(chart_data)
\ No newline at end of file
+    return chart_generator.create_natal_chart(chart_data, chart_format=chart_format)
\ No newline at end of file
@@ -7,7 +7,72 @@ Checks for potential security issues before committing to version control.
 import os
 import re
 import glob
+import mmap
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+# Hardcoded secret patterns, merged so each file is scanned in one pass.
+# Bytes patterns so files can be searched in place without decoding.
+_SECRET_RE = re.compile(
+    rb'sk-[a-zA-Z0-9]{48,}'  # OpenAI API keys
+    rb'|(?:api_key|secret_key|password)\s*=\s*["\'][^"\']+["\']',  # Key and password assignments (not env vars)
+    re.IGNORECASE
+)
+
+# Entries every .gitignore must contain
+_GITIGNORE_REQUIRED = ('.env', '*.db', '__pycache__', '.venv')
+
+# Seed scripts and the demo credentials they should not ship with, as bytes for searching mapped files
+_DEMO_CREDENTIAL_FILES = ('init_db.py', 'test_setup.py')
+_DEMO_INDICATORS = (b'demopassword', b'demo@example.com', b'test-key', b'dev-secret-key')
+
+# Below this many files a process pool costs more to start than the scan itself
+_PARALLEL_SCAN_MIN_FILES = 200
+
+# Database files that may hold user data
+_DB_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+# Directories never worth scanning
+_SKIP_DIRS = {'venv', 'env', 'node_modules', '__pycache__', 'site-packages'}
+
+@contextmanager
+def _mapped(path):
+    """Memory-map a file read-only; empty files, which mmap rejects, give b''"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _scan_file(file_path):
+    """Scan one file for a hardcoded secret, returning (secret or None, read error or None)"""
+    try:
+        with _mapped(file_path) as content:
+            # Skip if it's using os.environ
+            if content.find(b'os.environ') != -1 or content.find(b'os.getenv') != -1:
+                return None, None
+            match = _SECRET_RE.search(content)
+            return (match.group(0)[:20].decode('utf-8', 'replace') if match else None), None
+    except Exception as e:
+        return None, str(e)
+
+def _walk(root, suffixes):
+    """Yield paths of files ending in suffixes under root, skipping hidden and dependency directories"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    yield from _walk(entry.path, suffixes)
+            elif entry.name.endswith(suffixes):
+                yield entry.path
 
 class SecurityChecker:
     def __init__(self):
@@ -32,12 +97,7 @@ class SecurityChecker:
         """Check for database files that contain user data."""
         print("🔍 Checking for database files...")
         
-        db_patterns = ['*.db', '*.sqlite', '*.sqlite3']
-        db_files = []
-        
-        for pattern in db_patterns:
-            db_files.extend(glob.glob(pattern))
-            db_files.extend(glob.glob(f'**/{pattern}', recursive=True))
+        db_files = [os.path.relpath(path) for path in _walk('.', _DB_EXTENSIONS)]
         
         if db_files:
             for db_file in db_files:
@@ -49,33 +109,20 @@ class SecurityChecker:
         """Check for hardcoded API keys or secrets in Python files."""
         print("🔍 Checking for hardcoded secrets...")
         
-        secret_patterns = [
-            r'sk-[a-zA-Z0-9]{48,}',  # OpenAI API keys
-            r'api_key\s*=\s*["\'][^"\']+["\']',  # API key assignments
-            r'secret_key\s*=\s*["\'][^"\']+["\']',  # Secret key assignments (not env vars)
-            r'password\s*=\s*["\'][^"\']+["\']',  # Password assignments
-        ]
+        python_files = list(_walk('.', '.py'))
         
-        python_files = glob.glob('**/*.py', recursive=True)
+        # Files are independent, so large trees are scanned across processes
+        if len(python_files) >= _PARALLEL_SCAN_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_scan_file, python_files, chunksize=32))
+        else:
+            results = map(_scan_file, python_files)
         
-        for file_path in python_files:
-            if file_path.startswith('.'):  # Skip hidden directories
-                continue
-                
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    for pattern in secret_patterns:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            # Skip if it's using os.environ
-                            if 'os.environ' in content or 'os.getenv' in content:
-                                continue
-                            self.issues.append(f"❌ Potential hardcoded secret in {file_path}: {matches[0][:20]}...")
-                            
-            except Exception as e:
-                self.warnings.append(f"⚠️  Could not read {file_path}: {e}")
+        for file_path, (secret, error) in zip(python_files, results):
+            if error:
+                self.warnings.append(f"⚠️  Could not read {file_path}: {error}")
+            elif secret:
+                self.issues.append(f"❌ Potential hardcoded secret in {os.path.relpath(file_path)}: {secret}...")
         
         print("✅ Hardcoded secrets check completed")
     
@@ -90,9 +137,7 @@ class SecurityChecker:
         with open('.gitignore', 'r') as f:
             gitignore_content = f.read()
         
-        essential_entries = ['.env', '*.db', '__pycache__', '.venv']
-        
-        for entry in essential_entries:
+        for entry in _GITIGNORE_REQUIRED:
             if entry not in gitignore_content:
                 self.issues.append(f"❌ .gitignore missing essential entry: {entry}")
         
@@ -102,29 +147,16 @@ class SecurityChecker:
         """Check for demo credentials that should be changed in production."""
         print("🔍 Checking for demo credentials...")
         
-        files_to_check = ['init_db.py', 'test_setup.py']
-        demo_indicators = ['demopassword', 'demo@example.com', 'test-key', 'dev-secret-key']
-        
-        for file_path in files_to_check:
+        for file_path in _DEMO_CREDENTIAL_FILES:
             if os.path.exists(file_path):
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        
-                        for indicator in demo_indicators:
-                            if indicator in content:
-                                self.warnings.append(f"⚠️  Demo credential found in {file_path}: {indicator}")
-                except UnicodeDecodeError:
-                    # Try with different encoding
-                    try:
-                        with open(file_path, 'r', encoding='latin-1') as f:
-                            content = f.read()
-                            
-                            for indicator in demo_indicators:
-                                if indicator in content:
-                                    self.warnings.append(f"⚠️  Demo credential found in {file_path}: {indicator}")
-                    except Exception:
-                        self.warnings.append(f"⚠️  Could not read {file_path} for credential check")
+                    # Indicators are ASCII, so the raw bytes can be searched whatever the encoding
+                    with _mapped(file_path) as content:
+                        for indicator in _DEMO_INDICATORS:
+                            if content.find(indicator) != -1:
+                                self.warnings.append(f"⚠️  Demo credential found in {file_path}: {indicator.decode()}")
+                except Exception:
+                    self.warnings.append(f"⚠️  Could not read {file_path} for credential check")
         
         print("✅ Demo credentials check completed")
     
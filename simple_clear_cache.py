@@ -5,54 +5,52 @@ Simple cache clearing script without heavy dependencies
 import os
 import shutil
 
-def clear_cache():
-    """Clear various cache directories"""
-    cache_dirs = [
-        '__pycache__',
+# Cache directories (or files) removed wherever the purge finds them, relative to the project root
+CACHE_PATHS = {
+    os.path.normpath(path) for path in (
         '.cache',
         'charts_output',
         'static/charts'
-    ]
-    
-    cleared_count = 0
+    )
+}
+
+def _purge(root, removed, errors):
+    """Remove cache paths, __pycache__ directories and .pyc files under root in a single pass"""
+    try:
+        entries = os.scandir(root)
+    except OSError as e:
+        errors.append(f"❌ Error scanning {root}: {e}")
+        return
     
-    for cache_dir in cache_dirs:
-        if os.path.exists(cache_dir):
+    with entries:
+        for entry in entries:
+            path = os.path.normpath(entry.path)
             try:
-                if os.path.isdir(cache_dir):
-                    shutil.rmtree(cache_dir)
-                    print(f"✅ Cleared directory: {cache_dir}")
-                    cleared_count += 1
-                else:
-                    os.remove(cache_dir)
-                    print(f"✅ Removed file: {cache_dir}")
-                    cleared_count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == '__pycache__' or path in CACHE_PATHS:
+                        shutil.rmtree(entry.path)
+                        removed.append(path)
+                    else:
+                        _purge(entry.path, removed, errors)
+                elif entry.name.endswith('.pyc') or path in CACHE_PATHS:
+                    os.unlink(entry.path)
+                    removed.append(path)
             except Exception as e:
-                print(f"❌ Error clearing {cache_dir}: {e}")
+                errors.append(f"❌ Error clearing {path}: {e}")
+
+def clear_cache():
+    """Clear various cache directories"""
+    removed = []
+    errors = []
+    _purge('.', removed, errors)
     
-    # Clear Python cache files
-    for root, dirs, files in os.walk('.'):
-        for dir_name in dirs[:]:
-            if dir_name == '__pycache__':
-                try:
-                    shutil.rmtree(os.path.join(root, dir_name))
-                    print(f"✅ Cleared __pycache__ in {root}")
-                    cleared_count += 1
-                    dirs.remove(dir_name)
-                except Exception as e:
-                    print(f"❌ Error clearing __pycache__ in {root}: {e}")
-        
-        for file_name in files:
-            if file_name.endswith('.pyc'):
-                try:
-                    os.remove(os.path.join(root, file_name))
-                    print(f"✅ Removed {file_name}")
-                    cleared_count += 1
-                except Exception as e:
-                    print(f"❌ Error removing {file_name}: {e}")
+    # One print for the whole report, console writes are slow
+    report = [f"✅ Cleared {path}" for path in removed] + errors
+    if report:
+        print('\n'.join(report))
     
-    print(f"\n🧹 Cache cleanup complete! {cleared_count} items cleared.")
+    print(f"\n🧹 Cache cleanup complete! {len(removed)} items cleared.")
     print("🔮 Ready for Swiss Ephemeris + Placidus house system!")
 
 if __name__ == "__main__":
-    clear_cache()
\ No newline at end of file
+    clear_cache()